@@ -4,6 +4,8 @@ FastAPI-based REST API for corpus research software
 """
 import sys
 import os
+import threading
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -25,11 +27,25 @@ from routers import usas
 from routers import sketch
 from routers import biblio
 from routers import corpus_resource
+from services.spacy_service import get_spacy_service
+from services.syntax_service import get_syntax_service
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Creating the syntax service starts loading its models in a background
+    # thread, so they are ready (or loading) before the first syntax request
+    get_syntax_service()
+    # Same for the annotation models, which are loaded process-wide once
+    threading.Thread(target=get_spacy_service().warmup, name="spacy-warmup", daemon=True).start()
+    yield
+
 
 app = FastAPI(
     title="Meta-Lingo API",
     description="Backend API for Meta-Lingo corpus research software",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware for Electron frontend
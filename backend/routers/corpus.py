@@ -478,7 +478,7 @@ async def reannotate_spacy(
         try:
             send_progress_sync(task_id, "spacy", 10, "Loading SpaCy service...")
             
-            from services.spacy_service import get_spacy_service
+            from services.spacy_service import get_spacy_service, save_annotation_json
             from services.usas_service import get_usas_service
             
             spacy_svc = get_spacy_service()
@@ -513,8 +513,7 @@ async def reannotate_spacy(
                     output_dir = Path(content_path).parent
                     spacy_path = output_dir / f"{base_name}.spacy.json"
                     
-                    with open(spacy_path, 'w', encoding='utf-8') as f:
-                        json.dump(result, f, ensure_ascii=False, indent=2)
+                    save_annotation_json(result, spacy_path)
                     
                     # Also run USAS annotation (50-80%)
                     send_progress_sync(task_id, "usas", 50, "Starting USAS annotation...")
@@ -1299,14 +1298,14 @@ async def update_transcript_segments(corpus_id: str, text_id: str, data: dict):
                 text_metadata = {}
         text_type = text_metadata.get('textType') if isinstance(text_metadata, dict) else None
         
-        # SpaCy re-annotation (synchronous)
+        # SpaCy re-annotation (parsed in a worker thread)
         try:
             from services.spacy_service import get_spacy_service
             spacy_svc = get_spacy_service()
             
             if spacy_svc.is_available(language):
                 logger.info(f"Regenerating SpaCy annotations for {len(existing_segments)} segments...")
-                spacy_result = spacy_svc.annotate_segments(existing_segments, language)
+                spacy_result = await spacy_svc.annotate_segments_async(existing_segments, language)
                 
                 if spacy_result.get("success"):
                     transcript_data['spacy_annotations'] = spacy_result
@@ -2665,7 +2664,7 @@ def process_text_spacy_sync(
     try:
         send_progress_sync(task_id, "initializing", 5, "Loading SpaCy model...")
         
-        from services.spacy_service import get_spacy_service
+        from services.spacy_service import get_spacy_service, save_annotation_json
         from services.usas_service import get_usas_service
         
         spacy_svc = get_spacy_service()
@@ -2739,8 +2738,7 @@ def process_text_spacy_sync(
             
             # Save annotation to JSON file
             spacy_path = output_dir / f"{base_name}.spacy.json"
-            with open(spacy_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, ensure_ascii=False, indent=2)
+            save_annotation_json(result, spacy_path)
             
             logger.info(f"Saved SpaCy annotation: {spacy_path}")
             
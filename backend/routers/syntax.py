@@ -3,6 +3,8 @@ Syntax Analysis Router
 API endpoints for constituency and dependency parsing
 """
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
@@ -27,6 +29,21 @@ class DependencyRequest(BaseModel):
     collapse_phrases: bool = False
 
 
+class BatchSyntaxRequest(BaseModel):
+    """Request model for batched syntax analysis"""
+    sentences: List[str]
+    language: str = "english"
+
+
+class BatchDependencyRequest(BaseModel):
+    """Request model for batched dependency parsing with options"""
+    sentences: List[str]
+    language: str = "english"
+    compact: bool = False
+    collapse_punct: bool = True
+    collapse_phrases: bool = False
+
+
 class ConstituencyResponse(BaseModel):
     """Response model for constituency parsing"""
     success: bool
@@ -70,7 +87,7 @@ async def analyze_constituency(request: SyntaxRequest):
     if not request.sentence.strip():
         raise HTTPException(status_code=400, detail="Sentence cannot be empty")
     
-    result = service.analyze_constituency(
+    result = await service.analyze_constituency_async(
         sentence=request.sentence.strip(),
         language=request.language
     )
@@ -94,7 +111,7 @@ async def analyze_dependency(request: DependencyRequest):
     if not request.sentence.strip():
         raise HTTPException(status_code=400, detail="Sentence cannot be empty")
     
-    result = service.analyze_dependency(
+    result = await service.analyze_dependency_async(
         sentence=request.sentence.strip(),
         language=request.language,
         compact=request.compact,
@@ -105,6 +122,51 @@ async def analyze_dependency(request: DependencyRequest):
     return DependencyResponse(**result)
 
 
+@router.post("/constituency/batch", response_model=List[ConstituencyResponse])
+async def analyze_constituency_batch(request: BatchSyntaxRequest):
+    """
+    Perform constituency parsing on several sentences in one batched pass
+    
+    Returns one result per sentence, in request order
+    """
+    service = get_syntax_service()
+    
+    sentences = [sentence.strip() for sentence in request.sentences]
+    if not sentences or not all(sentences):
+        raise HTTPException(status_code=400, detail="Sentences cannot be empty")
+    
+    results = await service.analyze_constituency_batch_async(
+        sentences=sentences,
+        language=request.language
+    )
+    
+    return [ConstituencyResponse(**result) for result in results]
+
+
+@router.post("/dependency/batch", response_model=List[DependencyResponse])
+async def analyze_dependency_batch(request: BatchDependencyRequest):
+    """
+    Perform dependency parsing on several sentences in one batched pass
+    
+    Returns one result per sentence, in request order (same options as /dependency)
+    """
+    service = get_syntax_service()
+    
+    sentences = [sentence.strip() for sentence in request.sentences]
+    if not sentences or not all(sentences):
+        raise HTTPException(status_code=400, detail="Sentences cannot be empty")
+    
+    results = await service.analyze_dependency_batch_async(
+        sentences=sentences,
+        language=request.language,
+        compact=request.compact,
+        collapse_punct=request.collapse_punct,
+        collapse_phrases=request.collapse_phrases
+    )
+    
+    return [DependencyResponse(**result) for result in results]
+
+
 @router.get("/status", response_model=StatusResponse)
 async def get_status():
     """
@@ -114,9 +176,14 @@ async def get_status():
     """
     service = get_syntax_service()
     
+    # The checks load the models (or wait for the startup warmup to finish),
+    # so they run in a worker thread instead of blocking the event loop
+    constituency_available = await asyncio.to_thread(service.is_constituency_available)
+    dependency_available = await asyncio.to_thread(service.is_dependency_available, "english")
+    
     return StatusResponse(
-        constituency_available=service.is_constituency_available(),
-        dependency_available=service.is_dependency_available("english"),
+        constituency_available=constituency_available,
+        dependency_available=dependency_available,
         dependency_languages=["english", "chinese"]
     )
 
@@ -58,6 +58,7 @@ class EmbeddingRequest(BaseModel):
     batch_size: int = 32
     device: str = "cpu"
     normalize: bool = False
+    half_precision: bool = False
     language: str = "english"
     chunking: Optional[ChunkingConfig] = None
 
@@ -75,6 +76,8 @@ class ClusteringConfig(BaseModel):
 class VectorizerConfig(BaseModel):
     type: str = "CountVectorizer"
     params: Dict[str, Any] = {}
+    # Documents are already lowercased: skip the vectorizer's lowercasing pass
+    lowercased: bool = False
 
 
 class RepresentationModelConfig(BaseModel):
@@ -86,6 +89,8 @@ class OutlierConfig(BaseModel):
     enabled: bool = False
     strategy: str = "distributions"
     threshold: float = 0.0
+    # False keeps the fitted topic keywords instead of recomputing c-TF-IDF
+    update_topic_representations: bool = True
 
 
 class DynamicTopicConfig(BaseModel):
@@ -108,6 +113,7 @@ class AnalysisRequest(BaseModel):
     calculate_probabilities: bool = False
     dynamic_topic: Optional[DynamicTopicConfig] = None
     language: str = "english"  # Corpus language for vectorizer tokenization
+    accelerator: str = "cpu"  # "cuda" runs UMAP/HDBSCAN on GPU via cuML when installed
 
 
 class OllamaNamingRequest(BaseModel):
@@ -247,7 +253,8 @@ async def create_embedding(request: EmbeddingRequest):
             text_ids=chunk_text_ids,  # Each chunk's corresponding text_id
             batch_size=request.batch_size,
             device=request.device,
-            normalize=request.normalize
+            normalize=request.normalize,
+            half_precision=request.half_precision
         )
         
         # Add preprocess stats and chunk info
@@ -372,7 +379,8 @@ async def analyze_topics(request: AnalysisRequest):
             'vectorizer': request.vectorizer.model_dump(),
             'representation_model': request.representation_model.model_dump(),
             'reduce_outliers': request.reduce_outliers.model_dump(),
-            'calculate_probabilities': request.calculate_probabilities
+            'calculate_probabilities': request.calculate_probabilities,
+            'accelerator': request.accelerator
         }
         logger.info(f"Clustering config: {clustering_data}")
         
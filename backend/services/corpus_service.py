@@ -557,7 +557,7 @@ class CorpusService:
             SpaCy annotation result or None
         """
         try:
-            from services.spacy_service import get_spacy_service
+            from services.spacy_service import get_spacy_service, save_annotation_json
             
             spacy_svc = get_spacy_service()
             if not spacy_svc.is_available(language):
@@ -570,8 +570,7 @@ class CorpusService:
             if result.get("success"):
                 # Save annotation to JSON file
                 spacy_path = output_dir / f"{base_name}.spacy.json"
-                with open(spacy_path, 'w', encoding='utf-8') as f:
-                    json.dump(result, f, ensure_ascii=False, indent=2)
+                save_annotation_json(result, spacy_path)
                 
                 logger.info(f"Saved SpaCy annotation: {spacy_path}")
                 return {
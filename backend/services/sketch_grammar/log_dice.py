@@ -16,6 +16,7 @@ Where:
 """
 
 import math
+import heapq
 import logging
 from typing import Dict, List, Any, Tuple, Optional
 from dataclasses import dataclass, field
@@ -24,9 +25,9 @@ from collections import defaultdict
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CollocationScore:
-    """Stores collocation with its logDice score"""
+    """Stores collocation with its logDice score (slotted: one instance per collocation)"""
     word1: str
     word1_lemma: str
     word1_pos: str
@@ -37,6 +38,11 @@ class CollocationScore:
     frequency: int
     log_dice: float
     positions: List[Tuple[int, int, int]] = field(default_factory=list)
+    # Per-word frequencies/scores, only set for shared collocations in sketch differences
+    freq1: Optional[int] = None
+    freq2: Optional[int] = None
+    score1: Optional[float] = None
+    score2: Optional[float] = None
 
 
 def calculate_log_dice(
@@ -78,7 +84,9 @@ def calculate_log_dice(
 def calculate_batch_log_dice(
     relation_data: Dict[str, List[Dict[str, Any]]],
     min_frequency: int = 2,
-    min_score: float = 0.0
+    min_score: float = 0.0,
+    max_results: Optional[int] = None,
+    total_counts: Optional[Dict[str, int]] = None
 ) -> Dict[str, List[CollocationScore]]:
     """
     Calculate logDice scores for all collocations in relation data
@@ -88,6 +96,10 @@ def calculate_batch_log_dice(
                       Each dict should have: word1_lemma, word2_lemma, frequency, etc.
         min_frequency: Minimum frequency threshold
         min_score: Minimum logDice score threshold
+        max_results: Optional limit per relation; only the top-scored collocations
+                     are kept (heap selection instead of a full sort)
+        total_counts: Optional dict filled with the number of collocations per
+                      relation that passed the thresholds, before max_results
         
     Returns:
         Dict mapping relation names to lists of CollocationScore sorted by score
@@ -145,8 +157,14 @@ def calculate_batch_log_dice(
             )
             scored_collocations.append(scored_coll)
         
-        # Sort by logDice score
-        scored_collocations.sort(key=lambda x: x.log_dice, reverse=True)
+        if total_counts is not None:
+            total_counts[relation_name] = len(scored_collocations)
+        
+        # Sort by logDice score (top-k selection when limited)
+        if max_results is not None and max_results < len(scored_collocations):
+            scored_collocations = heapq.nlargest(max_results, scored_collocations, key=lambda x: x.log_dice)
+        else:
+            scored_collocations.sort(key=lambda x: x.log_dice, reverse=True)
         results[relation_name] = scored_collocations
     
     return results
@@ -156,7 +174,10 @@ def calculate_sketch_scores(
     word: str,
     word_pos: str,
     aggregated_relations: Dict[str, List[Any]],
-    global_frequencies: Optional[Dict[str, Dict[str, int]]] = None
+    global_frequencies: Optional[Dict[str, Dict[str, int]]] = None,
+    min_score: float = 0.0,
+    max_results: Optional[int] = None,
+    total_counts: Optional[Dict[str, int]] = None
 ) -> Dict[str, List[CollocationScore]]:
     """
     Calculate logDice scores for a word's sketch
@@ -166,6 +187,9 @@ def calculate_sketch_scores(
         word_pos: POS of target word
         aggregated_relations: Aggregated relation data from SketchGrammarEngine
         global_frequencies: Optional pre-computed global frequencies for better scoring
+        min_score: Minimum logDice score threshold
+        max_results: Optional maximum collocations kept per relation
+        total_counts: Optional dict filled with per-relation counts before truncation
         
     Returns:
         Dict mapping relation names to scored collocations
@@ -188,7 +212,12 @@ def calculate_sketch_scores(
             })
         
         if coll_dicts:
-            scored = calculate_batch_log_dice({relation_name: coll_dicts})
+            scored = calculate_batch_log_dice(
+                {relation_name: coll_dicts},
+                min_score=min_score,
+                max_results=max_results,
+                total_counts=total_counts
+            )
             if relation_name in scored:
                 results[relation_name] = scored[relation_name]
     
@@ -255,13 +284,13 @@ def compare_sketches(
                             word2_pos=coll.word2_pos,
                             frequency=coll.frequency,  # word1's frequency
                             log_dice=coll.log_dice,
-                            positions=coll.positions
+                            positions=coll.positions,
+                            # Store both frequencies for comparison
+                            freq1=coll.frequency,
+                            freq2=coll2.frequency,
+                            score1=coll.log_dice,
+                            score2=coll2.log_dice
                         )
-                        # Store both frequencies as custom attributes
-                        merged.__dict__['freq1'] = coll.frequency
-                        merged.__dict__['freq2'] = coll2.frequency
-                        merged.__dict__['score1'] = coll.log_dice
-                        merged.__dict__['score2'] = coll2.log_dice
                         shared.append(merged)
                         break
             elif coll.word2_lemma in word1_only_lemmas:
@@ -22,6 +22,28 @@ from .grammar_patterns import (
 logger = logging.getLogger(__name__)
 
 
+def ensure_lowercased(spacy_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Cache lowercased lemma/text on each token of a SpaCy annotation dict.
+    
+    Adds '_lemma_lower' and '_text_lower' to every token once, so repeated
+    extraction and search passes over the same data avoid calling .lower()
+    per token per query.
+    
+    Args:
+        spacy_data: SpaCy annotation data (modified in place)
+        
+    Returns:
+        The same spacy_data dict
+    """
+    if not spacy_data.get('_lc_cached'):
+        for token in spacy_data.get('tokens', []):
+            token['_lemma_lower'] = token.get('lemma', '').lower()
+            token['_text_lower'] = token.get('text', '').lower()
+        spacy_data['_lc_cached'] = True
+    return spacy_data
+
+
 @dataclass
 class RelationInstance:
     """Represents a single instance of a grammatical relation"""
@@ -85,7 +107,7 @@ class SketchGrammarEngine:
         """
         relations = []
         
-        tokens = spacy_data.get('tokens', [])
+        tokens = ensure_lowercased(spacy_data).get('tokens', [])
         if not tokens:
             return relations
         
@@ -101,8 +123,8 @@ class SketchGrammarEngine:
             if token.get('is_punct') or token.get('is_space'):
                 continue
                 
-            token_lemma = token.get('lemma', '').lower()
-            token_text = token.get('text', '').lower()
+            token_lemma = token['_lemma_lower']
+            token_text = token['_text_lower']
             token_pos = token.get('pos', '')
             
             # Apply target word filter if specified
@@ -160,7 +182,7 @@ class SketchGrammarEngine:
         """Extract relations matching a specific pattern"""
         relations = []
         
-        center_lemma = center_token.get('lemma', '').lower()
+        center_lemma = center_token['_lemma_lower']
         center_text = center_token.get('text', '')
         center_pos = center_token.get('pos', '')
         center_dep = center_token.get('dep', '')
@@ -329,7 +351,7 @@ class SketchGrammarEngine:
     ) -> Optional[RelationInstance]:
         """Create a RelationInstance from matched tokens"""
         collocate_text = collocate.get('text', '')
-        collocate_lemma = collocate.get('lemma', '').lower()
+        collocate_lemma = collocate['_lemma_lower']
         collocate_pos = collocate.get('pos', '')
         
         # Skip if collocate is empty
@@ -431,7 +453,7 @@ class SketchGrammarEngine:
             List of RelationInstance for phrasal verbs
         """
         relations = []
-        tokens = spacy_data.get('tokens', [])
+        tokens = ensure_lowercased(spacy_data).get('tokens', [])
         token_by_idx = {i: tok for i, tok in enumerate(tokens)}
         sentences = spacy_data.get('sentences', [])
         
@@ -439,7 +461,7 @@ class SketchGrammarEngine:
             if token.get('pos') != 'VERB':
                 continue
             
-            verb_lemma = token.get('lemma', '').lower()
+            verb_lemma = token['_lemma_lower']
             verb_text = token.get('text', '')
             
             if target_verb and verb_lemma != target_verb.lower():
@@ -457,7 +479,7 @@ class SketchGrammarEngine:
                 if obj_token.get('head') == idx:
                     dep = obj_token.get('dep', '')
                     if dep in ['dobj', 'obj']:
-                        obj_lemma = obj_token.get('lemma', '').lower()
+                        obj_lemma = obj_token['_lemma_lower']
                         obj_pos = obj_token.get('pos', '')
                         
                         relation = RelationInstance(
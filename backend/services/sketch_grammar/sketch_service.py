@@ -4,13 +4,14 @@ High-level service for generating Word Sketches and Sketch Differences
 """
 
 import logging
-import json
+import re
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
+from operator import methodcaller
 
-from .sketch_engine import SketchGrammarEngine, get_sketch_engine, RelationFrequency
+from .sketch_engine import SketchGrammarEngine, get_sketch_engine, RelationFrequency, ensure_lowercased
 from .log_dice import (
     calculate_sketch_scores,
     compare_sketches,
@@ -94,9 +95,14 @@ class SketchService:
         # Aggregate relations
         aggregated = self.engine.aggregate_relations(all_relations, min_frequency)
         
-        # Calculate logDice scores
+        # Calculate logDice scores, keeping only the top results per relation.
+        # Scored at the default threshold (0) so total_count counts every
+        # collocation, as before; min_score is applied to the top results below
+        total_counts: Dict[str, int] = {}
         scored_relations = calculate_sketch_scores(
-            word, target_pos, aggregated
+            word, target_pos, aggregated,
+            max_results=max_results_per_relation,
+            total_counts=total_counts
         )
         
         # Format results
@@ -107,12 +113,12 @@ class SketchService:
             # Get pattern info for display names
             pattern = get_pattern_by_name(relation_name)
             
-            # Filter by min_score and limit results
+            # Top results are sorted by score, so filtering them gives the same
+            # collocations as filtering everything and then limiting
             filtered_colls = [c for c in collocations if c.log_dice >= min_score]
-            limited_colls = filtered_colls[:max_results_per_relation]
             
             coll_list = []
-            for coll in limited_colls:
+            for coll in filtered_colls:
                 total_instances += coll.frequency
                 coll_list.append({
                     'word': coll.word2,
@@ -130,7 +136,7 @@ class SketchService:
                     'display_zh': pattern.display_zh.replace('[动词]', word).replace('[名词]', word).replace('[形容词]', word).replace('[副词]', word) if pattern else relation_name,
                     'description': pattern.description if pattern else '',
                     'collocations': coll_list,
-                    'total_count': len(collocations)
+                    'total_count': total_counts.get(relation_name, len(collocations))
                 }
         
         return {
@@ -227,11 +233,11 @@ class SketchService:
                         'score': coll.log_dice
                     }
                     # Add comparison data for shared collocations
-                    if hasattr(coll, 'freq1'):
-                        item['freq1'] = coll.__dict__.get('freq1', 0)
-                        item['freq2'] = coll.__dict__.get('freq2', 0)
-                        item['score1'] = coll.__dict__.get('score1', 0)
-                        item['score2'] = coll.__dict__.get('score2', 0)
+                    if coll.freq1 is not None:
+                        item['freq1'] = coll.freq1
+                        item['freq2'] = coll.freq2
+                        item['score1'] = coll.score1
+                        item['score2'] = coll.score2
                     result.append(item)
                 return result
             
@@ -306,12 +312,14 @@ class SketchService:
         aggregated = self.engine.aggregate_relations(all_relations, min_frequency)
         
         # Build relation index for fast lookup
-        relation_index = defaultdict(lambda: defaultdict(list))
+        relation_index: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        unique_relations = 0
         
         for relation_name, freq_list in aggregated.items():
+            unique_relations += len(freq_list)
             for freq in freq_list:
                 # Index by word1 lemma
-                relation_index[freq.word1_lemma][relation_name].append({
+                relation_index.setdefault(freq.word1_lemma, {}).setdefault(relation_name, []).append({
                     'word2_lemma': freq.word2_lemma,
                     'word2_pos': freq.word2_pos,
                     'frequency': freq.frequency,
@@ -321,9 +329,9 @@ class SketchService:
         return {
             'success': True,
             'total_relations': len(all_relations),
-            'unique_relations': sum(len(v) for v in aggregated.values()),
+            'unique_relations': unique_relations,
             'relation_types': list(aggregated.keys()),
-            'index': dict(relation_index),
+            'index': relation_index,
             'annotated_at': datetime.now().isoformat()
         }
     
@@ -356,55 +364,46 @@ class SketchService:
         Returns:
             Matching collocations
         """
-        import re
-        
         # Prepare query
         if lowercase:
             query = query.lower()
         
-        # Build matcher function
+        # Build matcher function. Candidate words are already lowercased by
+        # the caller loop, so each matcher is bound once to a C-level callable
+        # instead of a per-call Python closure.
         if search_type == 'exact':
-            def matches(word: str) -> bool:
-                w = word.lower() if lowercase else word
-                return w == query
+            matches = query.__eq__
         elif search_type == 'starts':
-            def matches(word: str) -> bool:
-                w = word.lower() if lowercase else word
-                return w.startswith(query)
+            matches = methodcaller('startswith', query)
         elif search_type == 'ends':
-            def matches(word: str) -> bool:
-                w = word.lower() if lowercase else word
-                return w.endswith(query)
+            matches = methodcaller('endswith', query)
         elif search_type == 'contains':
-            def matches(word: str) -> bool:
-                w = word.lower() if lowercase else word
-                return query in w
+            matches = methodcaller('__contains__', query)
         elif search_type == 'regex' or use_regex:
             try:
-                pattern = re.compile(query, re.IGNORECASE if lowercase else 0)
-                def matches(word: str) -> bool:
-                    return bool(pattern.search(word))
+                matches = re.compile(query, re.IGNORECASE if lowercase else 0).search
             except re.error:
                 return {'success': False, 'error': 'Invalid regex pattern'}
         elif search_type == 'wordlist':
-            words = set(w.strip().lower() if lowercase else w.strip() 
-                       for w in query.split('\n') if w.strip())
-            def matches(word: str) -> bool:
-                w = word.lower() if lowercase else word
-                return w in words
+            words = frozenset(w.strip().lower() if lowercase else w.strip() 
+                              for w in query.split('\n') if w.strip())
+            matches = words.__contains__
         else:
             def matches(word: str) -> bool:
                 return True
         
+        # Exclusion set is built once, not per token
+        excluded = frozenset(w.lower() for w in exclude_words) if exclude_words else frozenset()
+        
         # Extract and filter relations
         matching_results = []
         
         for spacy_data in corpus_spacy_data:
-            tokens = spacy_data.get('tokens', [])
+            tokens = ensure_lowercased(spacy_data).get('tokens', [])
             
             for idx, token in enumerate(tokens):
-                lemma = token.get('lemma', '').lower() if lowercase else token.get('lemma', '')
-                text = token.get('text', '').lower() if lowercase else token.get('text', '')
+                lemma = token['_lemma_lower'] if lowercase else token.get('lemma', '')
+                text = token['_text_lower'] if lowercase else token.get('text', '')
                 
                 if not matches(lemma) and not matches(text):
                     continue
@@ -418,10 +417,8 @@ class SketchService:
                         continue
                 
                 # Apply exclusion
-                if exclude_words:
-                    excluded = set(w.lower() for w in exclude_words)
-                    if lemma in excluded or text in excluded:
-                        continue
+                if excluded and (lemma in excluded or text in excluded):
+                    continue
                 
                 matching_results.append({
                     'word': token.get('text', ''),
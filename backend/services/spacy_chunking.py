@@ -7,7 +7,7 @@ import logging
 import re
 import json
 import time
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Dict, Iterable, List, Any, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -157,65 +157,61 @@ def chunk_text(text: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Tuple[in
     return chunks
 
 
+def _shift_spans(items: List[Dict[str, Any]], offset: int) -> List[Dict[str, Any]]:
+    """
+    Shift 'start'/'end' of each item by offset, in place.
+    
+    Chunk results are owned by the merge step, so the dicts are updated directly
+    instead of being copied; a zero offset (the first chunk) is a no-op.
+    """
+    if offset:
+        for item in items:
+            item['start'] += offset
+            item['end'] += offset
+    return items
+
+
 def adjust_token_indices(tokens: List[Dict[str, Any]], offset: int) -> List[Dict[str, Any]]:
     """
-    Adjust token indices by adding offset.
+    Adjust token indices by adding offset (in place).
     
     Args:
         tokens: List of token dictionaries
         offset: Character offset to add
         
     Returns:
-        List of tokens with adjusted indices
+        The same list with adjusted indices
     """
-    adjusted = []
-    for token in tokens:
-        adjusted_token = token.copy()
-        adjusted_token['start'] = token['start'] + offset
-        adjusted_token['end'] = token['end'] + offset
-        adjusted.append(adjusted_token)
-    return adjusted
+    return _shift_spans(tokens, offset)
 
 
 def adjust_entity_indices(entities: List[Dict[str, Any]], offset: int) -> List[Dict[str, Any]]:
     """
-    Adjust entity indices by adding offset.
+    Adjust entity indices by adding offset (in place).
     
     Args:
         entities: List of entity dictionaries
         offset: Character offset to add
         
     Returns:
-        List of entities with adjusted indices
+        The same list with adjusted indices
     """
-    adjusted = []
-    for entity in entities:
-        adjusted_entity = entity.copy()
-        adjusted_entity['start'] = entity['start'] + offset
-        adjusted_entity['end'] = entity['end'] + offset
-        adjusted.append(adjusted_entity)
-    return adjusted
+    return _shift_spans(entities, offset)
 
 
 def adjust_sentence_indices(sentences: List[Dict[str, Any]], offset: int) -> List[Dict[str, Any]]:
     """
-    Adjust sentence indices by adding offset.
+    Adjust sentence indices by adding offset (in place).
+    Sentence text is re-extracted from the original text during merge.
     
     Args:
         sentences: List of sentence dictionaries
         offset: Character offset to add
         
     Returns:
-        List of sentences with adjusted indices
+        The same list with adjusted indices
     """
-    adjusted = []
-    for sentence in sentences:
-        adjusted_sentence = sentence.copy()
-        adjusted_sentence['start'] = sentence['start'] + offset
-        adjusted_sentence['end'] = sentence['end'] + offset
-        # Re-extract text from original positions (will be done in merge)
-        adjusted.append(adjusted_sentence)
-    return adjusted
+    return _shift_spans(sentences, offset)
 
 
 def merge_annotations(
@@ -234,14 +230,62 @@ def merge_annotations(
     Returns:
         Merged annotation result
     """
-    # #region agent log
-    merge_start = time.time()
-    total_tokens = sum(len(r.get("tokens", [])) for r in chunk_results if r.get("success"))
-    total_entities = sum(len(r.get("entities", [])) for r in chunk_results if r.get("success"))
-    total_sentences = sum(len(r.get("sentences", [])) for r in chunk_results if r.get("success"))
-    # #endregion
+    # Order chunks by start position once (O(C log C) over chunks). Within a chunk,
+    # tokens/entities/sentences are already sorted by start, so extending in chunk
+    # order yields globally sorted lists without re-sorting every item.
+    ordered_chunks = sorted(zip(chunk_results, chunk_boundaries), key=lambda item: item[1][0])
+    
+    return merge_annotations_streaming(ordered_chunks, original_text)
+
+
+def merge_annotations_streaming(
+    chunk_items: Iterable[Tuple[Dict[str, Any], Tuple[int, int]]],
+    original_text: str
+) -> Dict[str, Any]:
+    """
+    Merge annotation results as chunks are produced, adjusting indices.
+    Each chunk is folded into the merged lists when it arrives, so the caller
+    never has to hold every chunk result at once.
+    
+    Args:
+        chunk_items: Iterable of (chunk result, (start, end)) in increasing start order
+        original_text: Original full text (for sentence text extraction)
+        
+    Returns:
+        Merged annotation result
+    """
+    all_tokens = []
+    all_entities = []
+    all_sentences = []
+    failed_chunks = []
+    total_chunks = 0
+    text_len = len(original_text)
+    
+    for i, (result, (chunk_start, chunk_end)) in enumerate(chunk_items):
+        total_chunks += 1
+        if not result.get("success"):
+            failed_chunks.append(i)
+            continue
+        
+        # Merge tokens
+        all_tokens.extend(adjust_token_indices(result.get("tokens", []), chunk_start))
+        
+        # Merge entities
+        all_entities.extend(adjust_entity_indices(result.get("entities", []), chunk_start))
+        
+        # Merge sentences
+        adjusted_sentences = adjust_sentence_indices(result.get("sentences", []), chunk_start)
+        
+        # Re-extract sentence text from original text
+        for sent in adjusted_sentences:
+            sent_start = sent['start']
+            sent_end = sent['end']
+            if sent_start < text_len and sent_end <= text_len:
+                sent['text'] = original_text[sent_start:sent_end]
+        
+        all_sentences.extend(adjusted_sentences)
     
-    if not chunk_results:
+    if not total_chunks:
         return {
             "success": False,
             "tokens": [],
@@ -251,68 +295,33 @@ def merge_annotations(
         }
     
     # Check if all chunks succeeded
-    failed_chunks = [i for i, result in enumerate(chunk_results) if not result.get("success")]
     if failed_chunks:
         logger.warning(f"Some chunks failed: {failed_chunks}")
     
-    # Merge tokens
-    # #region agent log
-    token_start = time.time()
-    # #endregion
-    all_tokens = []
-    for i, (result, (chunk_start, chunk_end)) in enumerate(zip(chunk_results, chunk_boundaries)):
-        if result.get("success"):
-            tokens = result.get("tokens", [])
-            adjusted_tokens = adjust_token_indices(tokens, chunk_start)
-            all_tokens.extend(adjusted_tokens)
-    
-    # Merge entities
-    all_entities = []
-    for i, (result, (chunk_start, chunk_end)) in enumerate(zip(chunk_results, chunk_boundaries)):
-        if result.get("success"):
-            entities = result.get("entities", [])
-            adjusted_entities = adjust_entity_indices(entities, chunk_start)
-            all_entities.extend(adjusted_entities)
-    
-    # Merge sentences
-    all_sentences = []
-    for i, (result, (chunk_start, chunk_end)) in enumerate(zip(chunk_results, chunk_boundaries)):
-        if result.get("success"):
-            sentences = result.get("sentences", [])
-            adjusted_sentences = adjust_sentence_indices(sentences, chunk_start)
-            
-            # Re-extract sentence text from original text
-            for sent in adjusted_sentences:
-                sent_start = sent['start']
-                sent_end = sent['end']
-                if sent_start < len(original_text) and sent_end <= len(original_text):
-                    sent['text'] = original_text[sent_start:sent_end]
-            
-            all_sentences.extend(adjusted_sentences)
-    
-    # Sort by start position to ensure order
-    all_tokens.sort(key=lambda x: x['start'])
-    all_entities.sort(key=lambda x: x['start'])
-    all_sentences.sort(key=lambda x: x['start'])
+    # Debug-only sanity check that the chunk-ordered merge is globally sorted
+    if __debug__ and logger.isEnabledFor(logging.DEBUG):
+        for items in (all_tokens, all_entities, all_sentences):
+            assert all(a['start'] <= b['start'] for a, b in zip(items, items[1:])), \
+                "Merged annotations are not sorted by start position"
     
     # Build merged result
     merged_result = {
-        "success": len(failed_chunks) == 0 or len(failed_chunks) < len(chunk_results),
+        "success": len(failed_chunks) == 0 or len(failed_chunks) < total_chunks,
         "tokens": all_tokens,
         "entities": all_entities,
         "sentences": all_sentences,
         "error": None,
         "chunk_info": {
-            "total_chunks": len(chunk_results),
-            "successful_chunks": len(chunk_results) - len(failed_chunks),
+            "total_chunks": total_chunks,
+            "successful_chunks": total_chunks - len(failed_chunks),
             "failed_chunks": failed_chunks
         }
     }
     
     if failed_chunks:
         merged_result["error"] = f"Some chunks failed: {failed_chunks}"
-        merged_result["warning"] = f"Processed {len(chunk_results) - len(failed_chunks)}/{len(chunk_results)} chunks successfully"
+        merged_result["warning"] = f"Processed {total_chunks - len(failed_chunks)}/{total_chunks} chunks successfully"
     
-    logger.info(f"Merged {len(chunk_results)} chunks: {len(all_tokens)} tokens, {len(all_entities)} entities, {len(all_sentences)} sentences")
+    logger.info(f"Merged {total_chunks} chunks: {len(all_tokens)} tokens, {len(all_entities)} entities, {len(all_sentences)} sentences")
     
     return merged_result
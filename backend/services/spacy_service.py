@@ -6,16 +6,28 @@ And Markdown structure recognition (headings, lists, blockquotes)
 With chunking support for long texts
 """
 
+import asyncio
 import logging
+import os
 import re
-import time
+import sys
 import json
+import multiprocessing
+import threading
 import traceback
-from typing import Dict, List, Any, Optional, Set, Tuple
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Set, Tuple, FrozenSet
 from .spacy_chunking import (
-    chunk_text, merge_annotations, DEFAULT_CHUNK_SIZE, MAX_CHUNK_SIZE
+    chunk_text, merge_annotations_streaming, DEFAULT_CHUNK_SIZE, MAX_CHUNK_SIZE
 )
 
+try:
+    import orjson  # Optional: much faster serialization of large annotation files
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -43,12 +55,18 @@ NAME_ABBREV_PATTERN = re.compile(r'\b[A-Z]\.\s*(?=[A-Z]|\s|$)')
 ORDERED_LIST_PATTERN = re.compile(r'(?:^|\n)\s*\d+\.\s')
 
 # Common titles/abbreviations that should not end sentences
-COMMON_ABBREVIATIONS = {
+COMMON_ABBREVIATIONS = frozenset({
     'mr', 'mrs', 'ms', 'dr', 'prof', 'sr', 'jr', 'vs', 'etc', 'inc', 'ltd',
     'corp', 'co', 'no', 'vol', 'rev', 'gen', 'col', 'lt', 'st', 'ave', 'blvd',
     'dept', 'univ', 'assn', 'bros', 'ph', 'ed', 'est', 'approx', 'govt',
     'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'
-}
+})
+
+# Longest abbreviation; bounds the window scanned before a period
+MAX_ABBREVIATION_LEN = max(len(abbrev) for abbrev in COMMON_ABBREVIATIONS)
+
+# Trailing ASCII word before a period (all abbreviations are ASCII letters)
+ABBREVIATION_WORD_PATTERN = re.compile(r'[A-Za-z]+\Z')
 
 # ==================== Markdown Pattern Detection ====================
 
@@ -64,35 +82,65 @@ MARKDOWN_BLOCKQUOTE_PATTERN = re.compile(r'(?:^|\n)\s*>\s*')
 # Empty line pattern (paragraph separator)
 EMPTY_LINE_PATTERN = re.compile(r'\n\s*\n')
 
+# Native newline: a newline followed (after spaces/tabs) by something other than
+# another newline or the end of text; the match ends where the content starts
+NATIVE_NEWLINE_PATTERN = re.compile(r'\n[ \t]*(?=[^\n \t])')
+
+# ==================== Fused Patterns ====================
+# Single-pass alternations over the patterns above, so each text is scanned once
+# instead of once per pattern. The individual patterns are kept for reference
+# and for callers that only need one kind of match.
+
+# All protected spans. URL comes first so emails/decimals inside URLs are covered
+# by the longer URL match; the name abbreviation checks its trailing whitespace by
+# lookahead only, so it cannot swallow the newline an ordered list item needs.
+PROTECTED_PATTERN = re.compile(
+    r'https?://\S+|www\.\S+'
+    r'|[\w.-]+@[\w.-]+\.\w+'
+    r'|\d+\.\d+'
+    r'|\b[A-Z]\.(?=[A-Z]|\s|$)'
+    r'|(?:^|\n)\s*\d+\.\s'
+)
+
+# All Markdown boundaries: an empty line, or a line start followed by a heading,
+# list or blockquote marker. Line starts are tried first and only consume the
+# newline itself (markers are matched by lookahead), so consecutive marked lines
+# and the line after an empty line are still seen.
+MARKDOWN_BOUNDARY_PATTERN = re.compile(
+    r'(?P<line>(?:^|\n)(?=#{1,6}\s|\s*(?:[-*+]\s|\d+\.\s|>)))'
+    r'|\n\s*\n'
+)
 
-def find_protected_spans(text: str) -> Set[Tuple[int, int]]:
+
+# Protected spans as parallel sorted lists (starts, ends) of non-overlapping intervals
+ProtectedSpans = Tuple[List[int], List[int]]
+
+
+def _merge_spans(spans: List[Tuple[int, int]]) -> ProtectedSpans:
+    """
+    Sort spans and merge overlapping ones in a single sweep.
+    Returns parallel (starts, ends) lists suitable for binary search.
+    """
+    starts: List[int] = []
+    ends: List[int] = []
+    for start, end in sorted(spans):
+        if ends and start <= ends[-1]:
+            if end > ends[-1]:
+                ends[-1] = end
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+def find_protected_spans(text: str) -> ProtectedSpans:
     """
     Find all character positions that contain periods which should NOT end sentences.
-    Returns a set of (start, end) tuples for protected spans.
+    Returns merged, sorted protected spans as parallel (starts, ends) lists.
     """
-    protected = set()
-    
-    # Find email spans
-    for match in EMAIL_PATTERN.finditer(text):
-        protected.add((match.start(), match.end()))
-    
-    # Find URL spans
-    for match in URL_PATTERN.finditer(text):
-        protected.add((match.start(), match.end()))
+    protected = [(match.start(), match.end()) for match in PROTECTED_PATTERN.finditer(text)]
     
-    # Find decimal number spans
-    for match in DECIMAL_PATTERN.finditer(text):
-        protected.add((match.start(), match.end()))
-    
-    # Find name abbreviation spans (e.g., "J. P." in "J. P. Morgan")
-    for match in NAME_ABBREV_PATTERN.finditer(text):
-        protected.add((match.start(), match.end()))
-    
-    # Find ordered list number spans (e.g., "1. " "2. " at line start)
-    for match in ORDERED_LIST_PATTERN.finditer(text):
-        protected.add((match.start(), match.end()))
-    
-    return protected
+    return _merge_spans(protected)
 
 
 def find_native_newlines(text: str) -> Set[int]:
@@ -103,32 +151,8 @@ def find_native_newlines(text: str) -> Set[int]:
     
     Returns a set of character positions that should start new segments.
     """
-    boundaries = set()
-    
-    # Find all single newline positions
-    i = 0
-    while i < len(text):
-        if text[i] == '\n':
-            # Check if this is part of an empty line (consecutive newlines or newline followed by whitespace then newline)
-            # Look ahead to see if there's content before the next newline
-            j = i + 1
-            
-            # Skip spaces/tabs (not newlines)
-            while j < len(text) and text[j] in ' \t':
-                j += 1
-            
-            # If we hit another newline or end of text, this is an empty line - skip
-            if j >= len(text) or text[j] == '\n':
-                i += 1
-                continue
-            
-            # This is a native newline with content following
-            # The boundary is at the start of actual content (after whitespace)
-            boundaries.add(j)
-        
-        i += 1
-    
-    return boundaries
+    # The boundary is at the start of actual content (after whitespace)
+    return {match.end() for match in NATIVE_NEWLINE_PATTERN.finditer(text)}
 
 
 def find_markdown_boundaries(text: str) -> Set[int]:
@@ -137,71 +161,92 @@ def find_markdown_boundaries(text: str) -> Set[int]:
     Returns a set of character positions that should start new sentences/paragraphs.
     """
     boundaries = set()
+    text_len = len(text)
     
-    # Find empty line boundaries (paragraph separators)
-    for match in EMPTY_LINE_PATTERN.finditer(text):
-        # The boundary is at the start of non-whitespace after the empty line
-        end_pos = match.end()
-        # Skip any remaining whitespace to find actual content start
-        while end_pos < len(text) and text[end_pos] in ' \t':
-            end_pos += 1
-        if end_pos < len(text):
-            boundaries.add(end_pos)
-    
-    # Find Markdown heading boundaries
-    for match in MARKDOWN_HEADING_PATTERN.finditer(text):
-        # Start of the # character (skip newline if present)
-        start = match.start()
-        if start > 0 and text[start] == '\n':
-            start += 1
-        boundaries.add(start)
-    
-    # Find unordered list item boundaries
-    for match in MARKDOWN_UNORDERED_LIST_PATTERN.finditer(text):
-        start = match.start()
-        if start > 0 and text[start] == '\n':
-            start += 1
-        # Skip whitespace to the list marker
-        while start < len(text) and text[start] in ' \t':
-            start += 1
-        boundaries.add(start)
-    
-    # Find ordered list item boundaries
-    for match in ORDERED_LIST_PATTERN.finditer(text):
-        start = match.start()
-        if start > 0 and text[start] == '\n':
-            start += 1
-        # Skip whitespace to the number
-        while start < len(text) and text[start] in ' \t':
-            start += 1
-        boundaries.add(start)
-    
-    # Find blockquote boundaries
-    for match in MARKDOWN_BLOCKQUOTE_PATTERN.finditer(text):
-        start = match.start()
-        if start > 0 and text[start] == '\n':
-            start += 1
-        # Skip whitespace to the >
-        while start < len(text) and text[start] in ' \t':
+    for match in MARKDOWN_BOUNDARY_PATTERN.finditer(text):
+        if match.lastgroup == 'line':
+            # Line start: skip the newline (if any), then leading spaces/tabs
+            start = match.start()
+            if start > 0 and text[start] == '\n':
+                start += 1
+        else:
+            # Empty line: the boundary is at the content after the last newline
+            start = match.end()
+        while start < text_len and text[start] in ' \t':
             start += 1
-        boundaries.add(start)
+        if start < text_len:
+            boundaries.add(start)
     
     return boundaries
 
 
-def is_sentence_boundary_valid(text: str, boundary_pos: int, protected_spans: Set[Tuple[int, int]]) -> bool:
+# Texts up to this length have their boundary scans memoized, so the custom
+# sentencizer and post_process_sentences share one pass over the same text
+BOUNDARY_CACHE_MAX_TEXT_LEN = 200000
+
+
+TextBoundaries = Tuple[ProtectedSpans, FrozenSet[int], FrozenSet[int], Tuple[int, ...]]
+
+
+def _scan_text_boundaries(text: str) -> TextBoundaries:
+    markdown_boundaries = frozenset(find_markdown_boundaries(text))
+    native_newlines = frozenset(find_native_newlines(text))
+    return (
+        find_protected_spans(text),
+        markdown_boundaries,
+        native_newlines,
+        # Union of both, sorted once so segments are found by binary search
+        tuple(sorted(native_newlines | markdown_boundaries))
+    )
+
+
+@lru_cache(maxsize=8)
+def _find_text_boundaries_cached(text: str) -> TextBoundaries:
+    return _scan_text_boundaries(text)
+
+
+def find_text_boundaries(text: str) -> TextBoundaries:
+    """
+    Get (protected_spans, markdown_boundaries, native_newlines, segment_boundaries)
+    for a text, where segment_boundaries is the sorted union of the two sets.
+    Results for texts below BOUNDARY_CACHE_MAX_TEXT_LEN come from a small LRU
+    cache and are shared, so callers must not modify them.
+    """
+    if len(text) < BOUNDARY_CACHE_MAX_TEXT_LEN:
+        return _find_text_boundaries_cached(text)
+    return _scan_text_boundaries(text)
+
+
+# Run of spaces, tabs and line breaks (possibly empty)
+WHITESPACE_RUN_PATTERN = re.compile(r'[ \t\n\r]*')
+
+# Sentence-ending punctuation
+SENTENCE_END_PATTERN = re.compile(r'[.!?]')
+
+
+def is_sentence_boundary_valid(
+    text: str,
+    boundary_pos: int,
+    protected_spans: ProtectedSpans,
+    reversed_text: Optional[str] = None
+) -> bool:
     """
     Check if a sentence boundary at the given position is valid.
     Returns False if the boundary falls within a protected span or after a protected period.
+    
+    reversed_text (text[::-1]) lets the whitespace before the boundary be skipped
+    with one forward regex match; pass it in when checking many boundaries.
     """
     if boundary_pos <= 0:
         return True
     
+    if reversed_text is None:
+        reversed_text = text[::-1]
+    
     # Check if the character before the boundary is a period
-    check_pos = boundary_pos - 1
-    # Skip whitespace backwards
-    while check_pos > 0 and text[check_pos] in ' \t\n\r':
-        check_pos -= 1
+    # Skip whitespace backwards (never past the first character)
+    whitespace_len = WHITESPACE_RUN_PATTERN.match(reversed_text, len(text) - boundary_pos).end() - (len(text) - boundary_pos)
+    check_pos = max(boundary_pos - 1 - whitespace_len, 0)
     
     # If we found a period, check if it's protected
     if check_pos >= 0 and text[check_pos] == '.':
@@ -213,6 +258,21 @@ def is_sentence_boundary_valid(text: str, boundary_pos: int, protected_spans: Se
     return True
 
 
+# Whitespace trimmed from the edges of split sentences
+SENTENCE_EDGE_WHITESPACE = ' \t\n\r'
+
+
+def _trim_span(text: str, start: int, end: int) -> Tuple[int, int]:
+    """
+    Shrink [start, end) to exclude leading/trailing spaces, tabs and line breaks.
+    Uses str.lstrip/rstrip so the scan runs in C rather than per character.
+    """
+    segment = text[start:end]
+    stripped = segment.lstrip(SENTENCE_EDGE_WHITESPACE)
+    start += len(segment) - len(stripped)
+    return start, start + len(stripped.rstrip(SENTENCE_EDGE_WHITESPACE))
+
+
 def post_process_sentences(text: str, raw_sentences: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Post-process SpaCy sentence boundaries to fix special cases.
@@ -250,17 +310,21 @@ def post_process_sentences(text: str, raw_sentences: List[Dict[str, Any]]) -> Li
         logger.info(f"Skipping sentence post-processing for large text ({len(text):,} chars, {len(raw_sentences):,} sentences)")
         return raw_sentences
     
-    # Find protected spans, native newlines and Markdown boundaries
-    protected_spans = find_protected_spans(text)
-    native_newlines = find_native_newlines(text)
-    markdown_boundaries = find_markdown_boundaries(text)
+    # Find protected spans and segment boundaries. Native newlines and Markdown
+    # boundaries are combined (native newlines have priority): both are segmentation
+    # points, but native newlines should always split. Their sorted union is
+    # computed once per text alongside the scans
+    protected_spans, _, _, all_segment_boundaries = find_text_boundaries(text)
     
-    # Combine native newlines and Markdown boundaries (native newlines have priority)
-    # Both are segmentation points, but native newlines should always split
-    all_segment_boundaries = native_newlines | markdown_boundaries
+    # Fast path: without segment boundaries or sentence-ending punctuation there is
+    # nothing to split or merge (protected spans only matter around punctuation),
+    # and sentences from doc.sents are already ordered and disjoint
+    if not all_segment_boundaries and SENTENCE_END_PATTERN.search(text) is None:
+        return raw_sentences
     
     # First pass: Merge sentences that were incorrectly split at protected positions
     merged_sentences = []
+    reversed_text = text[::-1]
     i = 0
     
     while i < len(raw_sentences):
@@ -271,7 +335,7 @@ def post_process_sentences(text: str, raw_sentences: List[Dict[str, Any]]) -> Li
             next_sent = raw_sentences[i + 1]
             
             # Check if the boundary between current and next is invalid (protected)
-            if not is_sentence_boundary_valid(text, next_sent['start'], protected_spans):
+            if not is_sentence_boundary_valid(text, next_sent['start'], protected_spans, reversed_text):
                 # Merge: extend current sentence to include next
                 current['text'] = text[current['start']:next_sent['end']]
                 current['end'] = next_sent['end']
@@ -290,18 +354,16 @@ def post_process_sentences(text: str, raw_sentences: List[Dict[str, Any]]) -> Li
         sent_end = sent['end']
         sent_text = text[sent_start:sent_end]
         
-        # Find all segment boundaries within this sentence
-        boundaries_in_sent = []
-        for boundary in all_segment_boundaries:
-            if sent_start < boundary < sent_end:
-                boundaries_in_sent.append(boundary)
+        # Find all segment boundaries within this sentence (already sorted)
+        lo = bisect_right(all_segment_boundaries, sent_start)
+        hi = bisect_left(all_segment_boundaries, sent_end)
+        boundaries_in_sent = list(all_segment_boundaries[lo:hi])
         
         if not boundaries_in_sent:
             # No boundaries, keep sentence as is
             final_sentences.append(sent)
         else:
             # Split at boundaries
-            boundaries_in_sent.sort()
             boundaries_in_sent.insert(0, sent_start)
             boundaries_in_sent.append(sent_end)
             
@@ -311,15 +373,8 @@ def post_process_sentences(text: str, raw_sentences: List[Dict[str, Any]]) -> Li
                 sub_text = text[sub_start:sub_end].strip()
                 
                 if sub_text:  # Only add non-empty sentences
-                    # Adjust start to skip leading whitespace
-                    actual_start = sub_start
-                    while actual_start < sub_end and text[actual_start] in ' \t\n\r':
-                        actual_start += 1
-                    
-                    # Adjust end to skip trailing whitespace
-                    actual_end = sub_end
-                    while actual_end > actual_start and text[actual_end - 1] in ' \t\n\r':
-                        actual_end -= 1
+                    # Adjust start/end to skip leading/trailing whitespace
+                    actual_start, actual_end = _trim_span(text, sub_start, sub_end)
                     
                     if actual_start < actual_end:
                         final_sentences.append({
@@ -331,58 +386,50 @@ def post_process_sentences(text: str, raw_sentences: List[Dict[str, Any]]) -> Li
     # Third pass: Further split by sentence-ending punctuation within each segment
     result_sentences = []
     
+    # Find sentence-ending punctuation in one scan of the whole text, dropping
+    # protected positions and abbreviation periods up front; each segment then
+    # takes its slice of candidates by binary search
+    punct_positions = [
+        match.start() for match in SENTENCE_END_PATTERN.finditer(text)
+        if not is_position_protected(match.start(), protected_spans)
+        and not is_abbreviation_period(text, match.start())
+    ]
+    
     for sent in final_sentences:
         sent_start = sent['start']
         sent_end = sent['end']
-        sent_text = text[sent_start:sent_end]
         
-        # Find sentence-ending punctuation
+        lo = bisect_left(punct_positions, sent_start)
+        hi = bisect_left(punct_positions, sent_end, lo)
+        
         sentence_endings = []
-        for match in re.finditer(r'[.!?]', sent_text):
-            pos_in_sent = match.start()
-            pos_in_text = sent_start + pos_in_sent
-            
-            # Check if this is a valid sentence boundary
-            if is_position_protected(pos_in_text, protected_spans):
-                continue
-            if is_abbreviation_period(text, pos_in_text):
-                continue
-            
+        for pos_in_text in punct_positions[lo:hi]:
             # Check if followed by space and uppercase (or end of segment)
-            after_pos = pos_in_sent + 1
-            if after_pos < len(sent_text):
+            after_pos = pos_in_text + 1
+            if after_pos < sent_end:
                 # Skip whitespace
-                while after_pos < len(sent_text) and sent_text[after_pos] in ' \t\n\r':
-                    after_pos += 1
+                after_pos = WHITESPACE_RUN_PATTERN.match(text, after_pos, sent_end).end()
                 
                 # If next char is lowercase, not a sentence boundary
-                if after_pos < len(sent_text) and sent_text[after_pos].islower():
+                if after_pos < sent_end and text[after_pos].islower():
                     continue
             
-            sentence_endings.append(pos_in_sent + 1)  # Include the punctuation
+            sentence_endings.append(pos_in_text + 1)  # Include the punctuation
         
         if not sentence_endings:
             result_sentences.append(sent)
         else:
             # Split at sentence endings
-            sentence_endings.insert(0, 0)
-            sentence_endings.append(len(sent_text))
+            sentence_endings.insert(0, sent_start)
+            sentence_endings.append(sent_end)
             
             for j in range(len(sentence_endings) - 1):
-                sub_start_rel = sentence_endings[j]
-                sub_end_rel = sentence_endings[j + 1]
-                
-                # Skip leading whitespace
-                while sub_start_rel < sub_end_rel and sent_text[sub_start_rel] in ' \t\n\r':
-                    sub_start_rel += 1
+                # Skip leading/trailing whitespace
+                actual_start, actual_end = _trim_span(
+                    text, sentence_endings[j], sentence_endings[j + 1]
+                )
                 
-                # Skip trailing whitespace
-                while sub_end_rel > sub_start_rel and sent_text[sub_end_rel - 1] in ' \t\n\r':
-                    sub_end_rel -= 1
-                
-                if sub_start_rel < sub_end_rel:
-                    actual_start = sent_start + sub_start_rel
-                    actual_end = sent_start + sub_end_rel
+                if actual_start < actual_end:
                     result_sentences.append({
                         'text': text[actual_start:actual_end],
                         'start': actual_start,
@@ -407,12 +454,11 @@ def post_process_sentences(text: str, raw_sentences: List[Dict[str, Any]]) -> Li
     return result_sentences
 
 
-def is_position_protected(pos: int, protected_spans: Set[Tuple[int, int]]) -> bool:
-    """Check if a character position falls within any protected span."""
-    for start, end in protected_spans:
-        if start <= pos < end:
-            return True
-    return False
+def is_position_protected(pos: int, protected_spans: ProtectedSpans) -> bool:
+    """Check if a character position falls within any protected span (binary search)."""
+    starts, ends = protected_spans
+    idx = bisect_right(starts, pos) - 1
+    return idx >= 0 and pos < ends[idx]
 
 
 def is_abbreviation_period(text: str, period_pos: int) -> bool:
@@ -422,101 +468,136 @@ def is_abbreviation_period(text: str, period_pos: int) -> bool:
     if period_pos <= 0:
         return False
     
-    # Find the word before the period
-    word_start = period_pos - 1
-    while word_start > 0 and text[word_start - 1].isalpha():
-        word_start -= 1
-    
-    word_before = text[word_start:period_pos].lower()
-    
-    # Check if it's a known abbreviation
-    if word_before in COMMON_ABBREVIATIONS:
-        return True
+    # Find the word before the period with one regex call over a short window.
+    # A run longer than the window is cut to MAX_ABBREVIATION_LEN + 1 letters,
+    # which can never be a known abbreviation.
+    match = ABBREVIATION_WORD_PATTERN.search(text, max(0, period_pos - MAX_ABBREVIATION_LEN - 1), period_pos)
+    if match is not None:
+        word_start = match.start()
+        # Check if it's a known abbreviation (and not the tail of a longer word)
+        if match.group().lower() in COMMON_ABBREVIATIONS and not (word_start > 0 and text[word_start - 1].isalpha()):
+            return True
     
-    # Single letter followed by period (like initials: J. K. Rowling)
+    # Single letter followed by period (like initials: J. K. Rowling).
+    # The letter is compared after lowercasing, so this only holds for
+    # letters without a lowercase form; initials are protected by PROTECTED_PATTERN.
+    word_before = text[period_pos - 1].lower()
     if len(word_before) == 1 and word_before.isupper():
-        return True
+        return not (period_pos > 1 and text[period_pos - 1].isalpha() and text[period_pos - 2].isalpha())
     
     return False
 
 
-def set_custom_sentence_boundaries(doc):
+# Token attributes pulled in one Doc.to_array call (column order matters)
+try:
+    import numpy as np
+    from spacy.attrs import (
+        IDX, LENGTH, POS, TAG, LEMMA, DEP, HEAD, MORPH, IS_STOP, IS_PUNCT, IS_SPACE, SENT_START
+    )
+    TOKEN_ARRAY_ATTRS = [IDX, LENGTH, POS, TAG, LEMMA, DEP, HEAD, MORPH, IS_STOP, IS_PUNCT, IS_SPACE]
+    HEAD_COLUMN = TOKEN_ARRAY_ATTRS.index(HEAD)
+    SENTENCE_ARRAY_ATTRS = [IDX, LENGTH]
+except ImportError:
+    TOKEN_ARRAY_ATTRS = None
+    HEAD_COLUMN = None
+    SENTENCE_ARRAY_ATTRS = None
+
+
+def compute_sentence_starts(text: str, idxs: List[int], lengths: List[int]) -> List[int]:
     """
-    Custom component to set sentence boundaries, protecting special patterns
+    Decide sentence boundaries for a tokenized text, protecting special patterns
     and recognizing Markdown structure boundaries.
-    This function is called as a SpaCy pipeline component.
-    """
-    protected_spans = find_protected_spans(doc.text)
-    markdown_boundaries = find_markdown_boundaries(doc.text)
     
-    for i, token in enumerate(doc):
-        # Default: don't start a new sentence
-        if i == 0:
-            token.is_sent_start = True
-            continue
+    Args:
+        text: Document text
+        idxs: Character offset of each token
+        lengths: Character length of each token
         
-        prev_token = doc[i - 1]
-        token_pos = token.idx
+    Returns:
+        SENT_START value per token (1 = starts a sentence, -1 = does not)
+    """
+    if not idxs:
+        return []
+    
+    # Native newlines are exactly the first content position of each line after a newline
+    protected_spans, markdown_boundaries, native_newlines, _ = find_text_boundaries(text)
+    
+    # Default: don't start a new sentence
+    sent_starts = [-1] * len(idxs)
+    sent_starts[0] = 1
+    
+    prev_text = text[idxs[0]:idxs[0] + lengths[0]]
+    prev_end = idxs[0] + lengths[0]
+    
+    for i in range(1, len(idxs)):
+        token_pos = idxs[i]
+        token_text = text[token_pos:token_pos + lengths[i]]
+        prev_token_text, prev_token_end = prev_text, prev_end
+        prev_text, prev_end = token_text, token_pos + lengths[i]
         
         # Check if this token starts at a Markdown boundary
         if token_pos in markdown_boundaries:
-            token.is_sent_start = True
+            sent_starts[i] = 1
             continue
         
-        # Check for newline before token (potential Markdown line start)
-        # Look for Markdown markers at line start
+        # Check for Markdown markers at line start
         # ONLY mark as sentence start if this token IS the markdown marker itself
-        if token_pos > 0:
-            # Check if there's a newline before this token
-            text_before = doc.text[:token_pos]
-            last_newline = text_before.rfind('\n')
-            if last_newline >= 0:
-                line_start = last_newline + 1
-                # Calculate the position where actual content starts (after leading whitespace)
-                content_start = line_start
-                while content_start < len(doc.text) and doc.text[content_start] in ' \t':
-                    content_start += 1
-                
-                # Only mark as new sentence if this token is AT the content start position
-                # This prevents marking every word in the line as a new sentence
-                if token_pos == content_start:
-                    line_content = doc.text[line_start:token_pos + len(token.text)]
-                    line_stripped = line_content.lstrip()
-                    
-                    # Check for Markdown patterns at line start
-                    if line_stripped.startswith('#'):
-                        # This is a heading line - token is the # marker
-                        token.is_sent_start = True
-                        continue
-                    elif line_stripped and line_stripped[0] in '-*+':
-                        # Could be unordered list item - token is the list marker
-                        if len(line_stripped) > 1 and line_stripped[1] in ' \t':
-                            token.is_sent_start = True
-                            continue
-                    elif line_stripped.startswith('>'):
-                        # Blockquote - token is the > marker
-                        token.is_sent_start = True
-                        continue
+        # (i.e. it sits at the content start of its line). This prevents marking
+        # every word in the line as a new sentence
+        if token_pos in native_newlines:
+            # Only spaces/tabs precede the token on its line
+            line_stripped = token_text.lstrip()
+            
+            # Check for Markdown patterns at line start
+            if line_stripped.startswith('#'):
+                # This is a heading line - token is the # marker
+                sent_starts[i] = 1
+                continue
+            elif line_stripped and line_stripped[0] in '-*+':
+                # Could be unordered list item - token is the list marker
+                if len(line_stripped) > 1 and line_stripped[1] in ' \t':
+                    sent_starts[i] = 1
+                    continue
+            elif line_stripped.startswith('>'):
+                # Blockquote - token is the > marker
+                sent_starts[i] = 1
+                continue
         
         # Check if previous token ends with a sentence-ending punctuation
-        if prev_token.text in '.!?':
+        if prev_token_text in '.!?':
             # Check if this period is protected
-            period_pos = prev_token.idx + len(prev_token.text) - 1
+            period_pos = prev_token_end - 1
             
             if is_position_protected(period_pos, protected_spans):
                 # Protected position - don't start new sentence
-                token.is_sent_start = False
-            elif is_abbreviation_period(doc.text, period_pos):
+                continue
+            elif is_abbreviation_period(text, period_pos):
                 # Abbreviation - don't start new sentence
-                token.is_sent_start = False
-            elif token.text[0].isupper() or token.text[0] in '"\'([':
+                continue
+            elif token_text[0].isupper() or token_text[0] in '"\'([':
                 # Normal sentence boundary - start new sentence
-                token.is_sent_start = True
-            else:
-                # Lowercase after period - might be continuation
-                token.is_sent_start = False
-        else:
-            token.is_sent_start = False
+                sent_starts[i] = 1
+            # Lowercase after period - might be continuation
+    
+    return sent_starts
+
+
+def set_custom_sentence_boundaries(doc):
+    """
+    Custom component to set sentence boundaries, protecting special patterns
+    and recognizing Markdown structure boundaries.
+    This function is called as a SpaCy pipeline component.
+    """
+    if len(doc) == 0:
+        return doc
+    
+    # Read offsets for all tokens in one call instead of touching Token objects
+    idxs, lengths = doc.to_array(SENTENCE_ARRAY_ATTRS).T.tolist()
+    sent_starts = compute_sentence_starts(doc.text, idxs, lengths)
+    
+    # Write every sentence start in one bulk assignment. from_array reads the
+    # values as uint64, so -1 is passed as its two's complement
+    doc.from_array([SENT_START], np.array(sent_starts, dtype=np.int64).view(np.uint64))
     
     return doc
 
@@ -533,6 +614,240 @@ except ImportError:
     pass  # SpaCy not available
 
 
+# Annotations each pipeline component contributes to (en/zh_core_web models).
+# tok2vec feeds the tagger and parser, attribute_ruler and lemmatizer derive
+# POS/morph/lemma from the tagger output, and custom_sentencizer sets every
+# sentence start on its own, so sentences never need the parser.
+PIPELINE_COMPONENT_PROVIDES: Dict[str, FrozenSet[str]] = {
+    "tok2vec": frozenset({"pos", "tag", "morph", "lemma", "dep"}),
+    "tagger": frozenset({"pos", "tag", "morph", "lemma"}),
+    "attribute_ruler": frozenset({"pos", "morph", "lemma"}),
+    "lemmatizer": frozenset({"lemma"}),
+    "parser": frozenset({"dep"}),
+    "ner": frozenset({"ner"}),
+    "custom_sentencizer": frozenset({"sents"}),
+}
+
+# All annotation kinds accepted in the `needs` argument
+ANNOTATION_NEEDS = frozenset().union(*PIPELINE_COMPONENT_PROVIDES.values())
+
+
+def get_disabled_components(nlp, needs: Optional[Set[str]] = None) -> List[str]:
+    """
+    Get the pipeline components that can be skipped for the requested annotations.
+    
+    Args:
+        nlp: SpaCy nlp object
+        needs: Annotation kinds required (subset of ANNOTATION_NEEDS), or None for all
+        
+    Returns:
+        Names of components to disable; unknown components are always kept
+    """
+    if needs is None:
+        return []
+    
+    unknown = set(needs) - ANNOTATION_NEEDS
+    if unknown:
+        raise ValueError(f"Unknown annotation needs: {sorted(unknown)}")
+    
+    return [
+        name for name in nlp.pipe_names
+        if name in PIPELINE_COMPONENT_PROVIDES and not (PIPELINE_COMPONENT_PROVIDES[name] & needs)
+    ]
+
+
+# ==================== Model Cache ====================
+
+# Model names per language, in order of preference
+MODEL_CANDIDATES = {
+    "chinese": ("zh_core_web_lg", "zh_core_web_sm"),
+    "english": ("en_core_web_lg", "en_core_web_sm"),
+}
+
+# Chunks per nlp.pipe batch in chunked annotation (override with SPACY_BATCH_SIZE).
+# Each chunk is up to DEFAULT_CHUNK_SIZE characters, so batches stay small
+CHUNK_BATCH_SIZE = int(os.environ.get('SPACY_BATCH_SIZE', 4))
+
+# Multiprocess nlp.pipe only pays off for large multi-chunk texts (each worker
+# loads its own model copy)
+MULTIPROCESS_MIN_CHUNKS = 4
+MULTIPROCESS_MIN_TEXT_LEN = 100000
+
+# Loaded pipelines shared by every SpacyService instance, keyed by model name.
+# Loading en_core_web_lg takes seconds and hundreds of MB, so it happens once per process.
+_MODEL_CACHE: Dict[str, Any] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def get_chunk_process_count(total_chunks: int, text_len: int) -> int:
+    """
+    Get the number of worker processes for chunked nlp.pipe.
+    SPACY_N_PROCESS overrides the automatic choice of min(cpu count - 1, 4).
+    The packaged app stays single-process by default: multiprocess workers crash
+    frozen PyInstaller executables (same reason pyLDAvis runs with n_jobs=1).
+    Workers are only used automatically with the "fork" start method, where
+    they share the loaded model's memory copy-on-write; with "spawn" (macOS,
+    Windows) every worker would load its own copy of the model.
+    
+    Args:
+        total_chunks: Number of chunks to annotate
+        text_len: Total text length in characters
+        
+    Returns:
+        Process count for nlp.pipe (1 = in-process)
+    """
+    if total_chunks < MULTIPROCESS_MIN_CHUNKS or text_len <= MULTIPROCESS_MIN_TEXT_LEN:
+        return 1
+    
+    env_value = os.environ.get('SPACY_N_PROCESS')
+    if env_value:
+        try:
+            return max(1, int(env_value))
+        except ValueError:
+            logger.warning(f"Ignoring invalid SPACY_N_PROCESS value: {env_value}")
+    
+    if getattr(sys, 'frozen', False):
+        return 1
+    
+    # The first entry is the platform default; fork is not forced because it is
+    # unsafe on macOS and the server runs worker threads
+    start_method = multiprocessing.get_start_method(allow_none=True) or multiprocessing.get_all_start_methods()[0]
+    if start_method != 'fork':
+        return 1
+    
+    return max(1, min((os.cpu_count() or 1) - 1, 4))
+
+
+def _add_custom_sentencizer(nlp):
+    """
+    Add custom sentencizer component to the pipeline.
+    This improves sentence boundary detection for special cases.
+    """
+    try:
+        # Remove the default sentencizer if exists
+        if "sentencizer" in nlp.pipe_names:
+            nlp.remove_pipe("sentencizer")
+        
+        # Add our custom sentencizer before parser (if parser exists)
+        # Our component will run after tokenization but before other components
+        if "custom_sentencizer" not in nlp.pipe_names:
+            if "parser" in nlp.pipe_names:
+                nlp.add_pipe("custom_sentencizer", before="parser")
+            elif "ner" in nlp.pipe_names:
+                nlp.add_pipe("custom_sentencizer", before="ner")
+            else:
+                nlp.add_pipe("custom_sentencizer", last=True)
+            logger.info("Added custom_sentencizer to pipeline")
+    except Exception as e:
+        logger.warning(f"Could not add custom sentencizer: {e}")
+    
+    return nlp
+
+
+def _load_model_cached(name: str):
+    """
+    Load a SpaCy model with the custom sentencizer, reusing the process-wide copy.
+    
+    Args:
+        name: SpaCy model package name
+        
+    Returns:
+        SpaCy nlp object
+        
+    Raises:
+        OSError: If the model is not installed
+    """
+    with _MODEL_CACHE_LOCK:
+        nlp = _MODEL_CACHE.get(name)
+        if nlp is None:
+            import spacy
+            nlp = _add_custom_sentencizer(spacy.load(name))
+            _MODEL_CACHE[name] = nlp
+            logger.info(f"Loaded {name} model")
+        return nlp
+
+
+def _load_first_available_model(names: Tuple[str, ...]):
+    """
+    Load the first installed model from a preference list.
+    
+    Args:
+        names: Model package names, most preferred first
+        
+    Returns:
+        SpaCy nlp object or None if none is installed
+    """
+    for i, name in enumerate(names):
+        try:
+            nlp = _load_model_cached(name)
+            if i > 0:
+                logger.info(f"Using {name} model (fallback)")
+            return nlp
+        except OSError:
+            continue
+    return None
+
+
+def normalize_line_endings(text: str) -> str:
+    """
+    Normalize Windows (CRLF) and old Mac (CR) line endings to LF.
+    Returns the text itself (no copy) when it contains no carriage returns.
+    """
+    if '\r' not in text:
+        return text
+    text = text.replace('\r\n', '\n')
+    if '\r' in text:
+        text = text.replace('\r', '\n')
+    return text
+
+
+# Human-readable descriptions for entity labels (built once, looked up per entity)
+ENTITY_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
+    # English entities
+    "PERSON": "Person name",
+    "NORP": "Nationalities, religious or political groups",
+    "FAC": "Buildings, airports, highways, bridges, etc.",
+    "ORG": "Organizations, companies, agencies",  # also used by Chinese models
+    "GPE": "Countries, cities, states",  # also used by Chinese models
+    "LOC": "Non-GPE locations, mountain ranges, bodies of water",  # also used by Chinese models
+    "PRODUCT": "Objects, vehicles, foods, etc.",
+    "EVENT": "Named hurricanes, battles, wars, sports events",
+    "WORK_OF_ART": "Titles of books, songs, etc.",
+    "LAW": "Named documents made into laws",
+    "LANGUAGE": "Any named language",
+    "DATE": "Absolute or relative dates or periods",
+    "TIME": "Times smaller than a day",
+    "PERCENT": "Percentage, including %",
+    "MONEY": "Monetary values, including unit",
+    "QUANTITY": "Measurements, as of weight or distance",
+    "ORDINAL": "first, second, etc.",
+    "CARDINAL": "Numerals that do not fall under another type",
+    # Chinese entities
+    "PER": "Person name",
+})
+
+# Universal POS tag descriptions
+POS_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
+    "ADJ": "Adjective",
+    "ADP": "Adposition",
+    "ADV": "Adverb",
+    "AUX": "Auxiliary verb",
+    "CCONJ": "Coordinating conjunction",
+    "DET": "Determiner",
+    "INTJ": "Interjection",
+    "NOUN": "Noun",
+    "NUM": "Numeral",
+    "PART": "Particle",
+    "PRON": "Pronoun",
+    "PROPN": "Proper noun",
+    "PUNCT": "Punctuation",
+    "SCONJ": "Subordinating conjunction",
+    "SYM": "Symbol",
+    "VERB": "Verb",
+    "X": "Other"
+})
+
+
 class SpacyService:
     """SpaCy NLP annotation service"""
     
@@ -553,31 +868,6 @@ class SpacyService:
                 logger.warning("SpaCy is not installed")
         return self._spacy_available
     
-    def _add_custom_sentencizer(self, nlp):
-        """
-        Add custom sentencizer component to the pipeline.
-        This improves sentence boundary detection for special cases.
-        """
-        try:
-            # Remove the default sentencizer if exists
-            if "sentencizer" in nlp.pipe_names:
-                nlp.remove_pipe("sentencizer")
-            
-            # Add our custom sentencizer before parser (if parser exists)
-            # Our component will run after tokenization but before other components
-            if "custom_sentencizer" not in nlp.pipe_names:
-                if "parser" in nlp.pipe_names:
-                    nlp.add_pipe("custom_sentencizer", before="parser")
-                elif "ner" in nlp.pipe_names:
-                    nlp.add_pipe("custom_sentencizer", before="ner")
-                else:
-                    nlp.add_pipe("custom_sentencizer", last=True)
-                logger.info("Added custom_sentencizer to pipeline")
-        except Exception as e:
-            logger.warning(f"Could not add custom sentencizer: {e}")
-        
-        return nlp
-    
     def load_model(self, language: str):
         """
         Load SpaCy model for the specified language
@@ -591,48 +881,46 @@ class SpacyService:
         if not self._check_spacy():
             return None
         
-        import spacy
-        
         # Normalize language
         lang = language.lower()
         
         if lang in ['chinese', 'zh', 'zh-cn', 'mandarin']:
             if self.nlp_zh is None:
-                try:
-                    self.nlp_zh = spacy.load("zh_core_web_lg")
-                    logger.info("Loaded zh_core_web_lg model")
-                    self.nlp_zh = self._add_custom_sentencizer(self.nlp_zh)
-                except OSError:
-                    try:
-                        self.nlp_zh = spacy.load("zh_core_web_sm")
-                        logger.info("Loaded zh_core_web_sm model (fallback)")
-                        self.nlp_zh = self._add_custom_sentencizer(self.nlp_zh)
-                    except OSError:
-                        logger.error("No Chinese SpaCy model found. Install with: pip install ./models/zh_core_web_lg-3.8.0-py3-none-any.whl")
-                        return None
+                self.nlp_zh = _load_first_available_model(MODEL_CANDIDATES["chinese"])
+                if self.nlp_zh is None:
+                    logger.error("No Chinese SpaCy model found. Install with: pip install ./models/zh_core_web_lg-3.8.0-py3-none-any.whl")
+                    return None
             return self.nlp_zh
         else:
             # Default to English
             if self.nlp_en is None:
-                try:
-                    self.nlp_en = spacy.load("en_core_web_lg")
-                    logger.info("Loaded en_core_web_lg model")
-                    self.nlp_en = self._add_custom_sentencizer(self.nlp_en)
-                except OSError:
-                    try:
-                        self.nlp_en = spacy.load("en_core_web_sm")
-                        logger.info("Loaded en_core_web_sm model (fallback)")
-                        self.nlp_en = self._add_custom_sentencizer(self.nlp_en)
-                    except OSError:
-                        logger.error("No English SpaCy model found. Install with: pip install ./models/en_core_web_lg-3.8.0-py3-none-any.whl")
-                        return None
+                self.nlp_en = _load_first_available_model(MODEL_CANDIDATES["english"])
+                if self.nlp_en is None:
+                    logger.error("No English SpaCy model found. Install with: pip install ./models/en_core_web_lg-3.8.0-py3-none-any.whl")
+                    return None
             return self.nlp_en
     
+    def warmup(self, languages: Tuple[str, ...] = ("english",)) -> None:
+        """
+        Preload models so the first annotation request does not pay the load cost.
+        
+        Args:
+            languages: Languages whose models should be loaded
+        """
+        for language in languages:
+            self.load_model(language)
+    
     def is_available(self, language: str = "english") -> bool:
         """Check if SpaCy model is available for the language"""
         return self.load_model(language) is not None
     
-    def annotate_text(self, text: str, language: str = "english", chunk_size: Optional[int] = None) -> Dict[str, Any]:
+    def annotate_text(
+        self,
+        text: str,
+        language: str = "english",
+        chunk_size: Optional[int] = None,
+        needs: Optional[Set[str]] = None
+    ) -> Dict[str, Any]:
         """
         Perform full SpaCy annotation on text.
         Automatically uses chunking for long texts.
@@ -641,6 +929,9 @@ class SpacyService:
             text: Text to annotate
             language: Language code
             chunk_size: Optional chunk size override (default: DEFAULT_CHUNK_SIZE)
+            needs: Optional subset of ANNOTATION_NEEDS ("pos", "tag", "morph",
+                "lemma", "dep", "ner", "sents"); components serving none of
+                them are skipped and their fields are left empty
             
         Returns:
             Dictionary containing:
@@ -651,7 +942,7 @@ class SpacyService:
         # Normalize line endings to Unix style (\n) to match frontend display
         # This is critical: Windows \r\n (2 chars) vs Unix \n (1 char) causes
         # character offset drift that breaks annotation alignment
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
+        text = normalize_line_endings(text)
         
         # Process normally (chunking disabled to avoid hanging issues)
         result = {
@@ -668,61 +959,15 @@ class SpacyService:
             return result
         
         try:
-            doc = nlp(text)
-            
-            # Extract tokens with all annotations
-            for token in doc:
-                token_info = {
-                    "text": token.text,
-                    "start": token.idx,
-                    "end": token.idx + len(token.text),
-                    "pos": token.pos_,  # Universal POS tag
-                    "tag": token.tag_,  # Fine-grained POS tag
-                    "lemma": token.lemma_,
-                    "dep": token.dep_,  # Dependency relation
-                    "head": token.head.i,  # Index of head token
-                    "morph": str(token.morph) if token.morph else "",
-                    "is_stop": token.is_stop,
-                    "is_punct": token.is_punct,
-                    "is_space": token.is_space
-                }
-                result["tokens"].append(token_info)
+            doc = nlp(text, disable=get_disabled_components(nlp, needs))
+            result.update(self._extract_from_doc(doc, text, with_sentences=needs is None or "sents" in needs))
             
-            # Extract named entities
-            for ent in doc.ents:
-                entity_info = {
-                    "text": ent.text,
-                    "start": ent.start_char,
-                    "end": ent.end_char,
-                    "label": ent.label_,
-                    "description": self._get_entity_description(ent.label_)
-                }
-                result["entities"].append(entity_info)
-            
-            # Extract raw sentence boundaries from SpaCy
-            raw_sentences = []
-            for sent in doc.sents:
-                raw_sentences.append({
-                    "text": sent.text,
-                    "start": sent.start_char,
-                    "end": sent.end_char
-                })
-            
-            # PERFORMANCE: Skip post-processing for large texts
-            # Post-processing is O(n*m) and very slow for large texts
-            if len(text) > 100000 or len(raw_sentences) > 3000:
-                logger.info(f"Skipping post-processing for large text: {len(text):,} chars, {len(raw_sentences):,} sentences")
-                result["sentences"] = raw_sentences
-            else:
-                # Post-process sentences to fix special cases only for smaller texts
-                # (emails, URLs, decimals, abbreviations, Markdown structures)
-                result["sentences"] = post_process_sentences(text, raw_sentences)
-            
-            # DEBUG: Log sentence boundary verification
-            for i, sent in enumerate(result["sentences"][:3]):
-                actual_text = text[sent["start"]:sent["end"]]
-                match = actual_text == sent["text"]
-                logger.info(f"DEBUG Sentence {i}: start={sent['start']}, end={sent['end']}, text_match={match}, sent_text='{sent['text'][:40]}...', actual='{actual_text[:40]}...'")
+            # DEBUG: Log sentence boundary verification (only formatted when enabled)
+            if logger.isEnabledFor(logging.DEBUG):
+                for i, sent in enumerate(result["sentences"][:3]):
+                    actual_text = text[sent["start"]:sent["end"]]
+                    match = actual_text == sent["text"]
+                    logger.debug(f"Sentence {i}: start={sent['start']}, end={sent['end']}, text_match={match}, sent_text='{sent['text'][:40]}...', actual='{actual_text[:40]}...'")
             
             result["success"] = True
             logger.info(f"Annotated text: {len(result['tokens'])} tokens, {len(result['entities'])} entities, {len(result['sentences'])} sentences (post-processed)")
@@ -733,12 +978,149 @@ class SpacyService:
         
         return result
     
+    def annotate_texts(
+        self,
+        texts: List[str],
+        language: str = "english",
+        batch_size: int = 32,
+        needs: Optional[Set[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Perform full SpaCy annotation on many texts in one batched pass.
+        Texts are streamed through nlp.pipe, which amortizes per-call overhead
+        and lets the tagger/parser batch their work.
+        
+        Args:
+            texts: Texts to annotate
+            language: Language code
+            batch_size: Number of texts per nlp.pipe batch
+            needs: Optional subset of ANNOTATION_NEEDS (see annotate_text)
+            
+        Returns:
+            One result per input text, in the same shape as annotate_text
+        """
+        # Same line-ending normalization as annotate_text
+        texts = [normalize_line_endings(text) for text in texts]
+        
+        nlp = self.load_model(language)
+        if nlp is None:
+            return [{
+                "success": False,
+                "tokens": [],
+                "entities": [],
+                "sentences": [],
+                "error": f"SpaCy model not available for {language}"
+            } for _ in texts]
+        
+        results = []
+        try:
+            disable = get_disabled_components(nlp, needs)
+            with_sentences = needs is None or "sents" in needs
+            for text, doc in zip(texts, nlp.pipe(texts, batch_size=batch_size, disable=disable)):
+                result = {"success": True, "error": None}
+                result.update(self._extract_from_doc(doc, text, with_sentences=with_sentences))
+                results.append(result)
+            logger.info(f"Annotated {len(results)} texts in batches of {batch_size}")
+        except Exception as e:
+            logger.error(f"SpaCy batch annotation error: {e}")
+            # Texts not reached by the failed batch are reported as failures
+            results.extend({
+                "success": False,
+                "tokens": [],
+                "entities": [],
+                "sentences": [],
+                "error": str(e)
+            } for _ in range(len(texts) - len(results)))
+        
+        return results
+    
+    def _extract_from_doc(self, doc, text: str, with_sentences: bool = True) -> Dict[str, Any]:
+        """
+        Extract tokens, entities and post-processed sentences from a parsed Doc.
+        
+        Args:
+            doc: SpaCy Doc built from text
+            text: The text the Doc was built from (offsets are relative to it)
+            with_sentences: Whether sentence boundaries were computed for the Doc
+            
+        Returns:
+            Dictionary with 'tokens', 'entities' and 'sentences'
+        """
+        # Extract tokens with all annotations. All attributes are copied out in
+        # one to_array call instead of ~12 Cython attribute lookups per token.
+        # POS/TAG/LEMMA/DEP/MORPH come back as string-store hashes and HEAD as
+        # an offset from the token, stored unsigned.
+        array = doc.to_array(TOKEN_ARRAY_ATTRS)
+        (idxs, lengths, pos_ids, tag_ids, lemma_ids, dep_ids, _,
+         morph_ids, is_stops, is_puncts, is_spaces) = array.T.tolist()
+        head_offsets = array[:, HEAD_COLUMN].astype("int64").tolist()
+        
+        # Resolve each distinct hash once: labels repeat across the Doc, so
+        # tokens share one str object per label instead of decoding a new one
+        strings = doc.vocab.strings
+        empty_morph = doc.vocab.morphology.EMPTY_MORPH
+        names = {h: strings[h] for h in set(pos_ids).union(tag_ids, lemma_ids, dep_ids)}
+        morph_names = {h: strings[h] for h in set(morph_ids)}
+        for h, morph in morph_names.items():
+            if morph == empty_morph:
+                morph_names[h] = ""
+        
+        tokens = []
+        for i, idx in enumerate(idxs):
+            end = idx + lengths[i]
+            tokens.append({
+                "text": text[idx:end],
+                "start": idx,
+                "end": end,
+                "pos": names[pos_ids[i]],  # Universal POS tag
+                "tag": names[tag_ids[i]],  # Fine-grained POS tag
+                "lemma": names[lemma_ids[i]],
+                "dep": names[dep_ids[i]],  # Dependency relation
+                "head": i + head_offsets[i],  # Index of head token (relative to doc)
+                "morph": morph_names[morph_ids[i]],
+                "is_stop": bool(is_stops[i]),
+                "is_punct": bool(is_puncts[i]),
+                "is_space": bool(is_spaces[i])
+            })
+        
+        # Extract named entities
+        entities = []
+        for ent in doc.ents:
+            entities.append({
+                "text": ent.text,
+                "start": ent.start_char,
+                "end": ent.end_char,
+                "label": ent.label_,
+                "description": ENTITY_DESCRIPTIONS.get(ent.label_, ent.label_)
+            })
+        
+        # Extract raw sentence boundaries from SpaCy
+        raw_sentences = []
+        if with_sentences:
+            for sent in doc.sents:
+                raw_sentences.append({
+                    "text": sent.text,
+                    "start": sent.start_char,
+                    "end": sent.end_char
+                })
+        
+        # Post-process sentences to fix special cases (emails, URLs, decimals,
+        # abbreviations, Markdown structures); large texts are returned as-is
+        sentences = post_process_sentences(text, raw_sentences)
+        
+        return {
+            "tokens": tokens,
+            "entities": entities,
+            "sentences": sentences
+        }
+    
     def annotate_text_chunked(
         self, 
         text: str, 
         language: str = "english", 
         chunk_size: int = DEFAULT_CHUNK_SIZE,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        needs: Optional[Set[str]] = None
     ) -> Dict[str, Any]:
         """
         Perform SpaCy annotation on long text using chunking.
@@ -748,6 +1130,7 @@ class SpacyService:
             language: Language code
             chunk_size: Size of each chunk in characters
             progress_callback: Optional callback function(chunk_num, total_chunks, message)
+            needs: Optional subset of ANNOTATION_NEEDS (see annotate_text)
             
         Returns:
             Merged annotation result with adjusted indices
@@ -775,61 +1158,12 @@ class SpacyService:
             if progress_callback:
                 progress_callback(0, total_chunks, f"Starting chunked annotation ({total_chunks} chunks)")
             
-            # Process each chunk
-            chunk_results = []
-            chunk_boundaries = []
-            
-            for i, (chunk_start, chunk_end, chunk_text_segment) in enumerate(chunks):
-                chunk_num = i + 1
-                
-                # Send progress update BEFORE processing each chunk to avoid timeout
-                if progress_callback:
-                    progress_callback(chunk_num - 1, total_chunks, f"Starting chunk {chunk_num}/{total_chunks} ({chunk_end - chunk_start:,} chars)")
-                
-                logger.info(f"Processing chunk {chunk_num}/{total_chunks}: positions {chunk_start:,}-{chunk_end:,} ({chunk_end - chunk_start:,} chars)")
-                
-                try:
-                    # Process chunk using normal annotation
-                    # Note: We pass the nlp model to avoid reloading for each chunk
-                    # Also pass progress callback to allow periodic updates during processing
-                    chunk_result = self._annotate_single_chunk(
-                        chunk_text_segment, 
-                        language, 
-                        nlp,
-                        progress_callback=lambda msg: progress_callback(chunk_num, total_chunks, f"Chunk {chunk_num}/{total_chunks}: {msg}") if progress_callback else None,
-                        chunk_num=chunk_num,
-                        total_chunks=total_chunks
-                    )
-                    
-                    # Send progress update AFTER processing each chunk
-                    if progress_callback:
-                        progress_callback(chunk_num, total_chunks, f"Completed chunk {chunk_num}/{total_chunks} ({len(chunk_result.get('tokens', []))} tokens)")
-                    chunk_results.append(chunk_result)
-                    chunk_boundaries.append((chunk_start, chunk_end))
-                    
-                    if not chunk_result.get("success"):
-                        logger.warning(f"Chunk {chunk_num} failed: {chunk_result.get('error')}")
-                    else:
-                        logger.info(f"Chunk {chunk_num} completed: {len(chunk_result.get('tokens', []))} tokens, {len(chunk_result.get('entities', []))} entities")
-                
-                except Exception as e:
-                    logger.error(f"Error processing chunk {chunk_num}: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    chunk_results.append({
-                        "success": False,
-                        "tokens": [],
-                        "entities": [],
-                        "sentences": [],
-                        "error": str(e)
-                    })
-                    chunk_boundaries.append((chunk_start, chunk_end))
-            
-            # Merge results
-            if progress_callback:
-                progress_callback(total_chunks, total_chunks, "Merging chunk results...")
-            
-            merged_result = merge_annotations(chunk_results, chunk_boundaries, text)
+            # Parse chunks lazily and fold each into the merged result as it is
+            # produced, so per-chunk results are not all held before merging
+            merged_result = merge_annotations_streaming(
+                self._iter_chunk_results(chunks, language, nlp, len(text), progress_callback, needs),
+                text
+            )
             
             if progress_callback:
                 progress_callback(total_chunks, total_chunks, "Chunked annotation completed")
@@ -841,7 +1175,99 @@ class SpacyService:
             logger.error(f"SpaCy chunked annotation error: {e}")
             return result
     
-    def _annotate_single_chunk(self, chunk_text: str, language: str, nlp, progress_callback=None, chunk_num=0, total_chunks=0) -> Dict[str, Any]:
+    def _iter_chunk_results(
+        self,
+        chunks: List[Tuple[int, int, str]],
+        language: str,
+        nlp,
+        text_len: int,
+        progress_callback: Optional[callable] = None,
+        needs: Optional[Set[str]] = None
+    ):
+        """
+        Parse chunks in order, yielding (chunk result, (start, end)) per chunk.
+        A chunk that fails yields an unsuccessful result instead of raising.
+        
+        Args:
+            chunks: (start, end, text) tuples from chunk_text
+            language: Language code
+            nlp: Loaded SpaCy model
+            text_len: Length of the full text
+            progress_callback: Optional callback function(chunk_num, total_chunks, message)
+            needs: Optional subset of ANNOTATION_NEEDS (see annotate_text)
+        """
+        total_chunks = len(chunks)
+        
+        disable = get_disabled_components(nlp, needs)
+        with_sentences = needs is None or "sents" in needs
+        
+        # Stream all chunks through nlp.pipe so spaCy batches them internally;
+        # Docs are consumed one at a time so progress is still reported per chunk.
+        # With worker processes, each chunk is its own batch so all workers get work
+        n_process = get_chunk_process_count(total_chunks, text_len)
+        if n_process > 1:
+            logger.info(f"Parsing chunks with {n_process} worker processes")
+        docs = nlp.pipe(
+            (chunk_text_segment for _, _, chunk_text_segment in chunks),
+            batch_size=1 if n_process > 1 else CHUNK_BATCH_SIZE,
+            n_process=n_process,
+            disable=disable
+        )
+        
+        for i, (chunk_start, chunk_end, chunk_text_segment) in enumerate(chunks):
+            chunk_num = i + 1
+            
+            # Send progress update BEFORE processing each chunk to avoid timeout
+            if progress_callback:
+                progress_callback(chunk_num - 1, total_chunks, f"Starting chunk {chunk_num}/{total_chunks} ({chunk_end - chunk_start:,} chars)")
+            
+            logger.info(f"Processing chunk {chunk_num}/{total_chunks}: positions {chunk_start:,}-{chunk_end:,} ({chunk_end - chunk_start:,} chars)")
+            
+            try:
+                doc = None
+                if docs is not None:
+                    try:
+                        doc = next(docs)
+                    except Exception as e:
+                        # A failed batch ends the pipe; finish chunk by chunk so
+                        # one bad chunk does not fail the rest
+                        logger.warning(f"Batched parsing failed at chunk {chunk_num}, continuing chunk by chunk: {e}")
+                        docs = None
+                
+                if doc is not None:
+                    # Token indices (including head) are relative to the chunk
+                    chunk_result = {"success": True, "error": None}
+                    chunk_result.update(self._extract_from_doc(doc, chunk_text_segment, with_sentences=with_sentences))
+                else:
+                    # Note: We pass the nlp model to avoid reloading for each chunk
+                    chunk_result = self._annotate_single_chunk(chunk_text_segment, language, nlp, needs=needs)
+                
+                # Send progress update AFTER processing each chunk
+                if progress_callback:
+                    progress_callback(chunk_num, total_chunks, f"Completed chunk {chunk_num}/{total_chunks} ({len(chunk_result.get('tokens', []))} tokens)")
+                if not chunk_result.get("success"):
+                    logger.warning(f"Chunk {chunk_num} failed: {chunk_result.get('error')}")
+                else:
+                    logger.info(f"Chunk {chunk_num} completed: {len(chunk_result.get('tokens', []))} tokens, {len(chunk_result.get('entities', []))} entities")
+            
+            except Exception as e:
+                logger.error(f"Error processing chunk {chunk_num}: {e}")
+                import traceback
+                traceback.print_exc()
+                chunk_result = {
+                    "success": False,
+                    "tokens": [],
+                    "entities": [],
+                    "sentences": [],
+                    "error": str(e)
+                }
+            
+            yield chunk_result, (chunk_start, chunk_end)
+        
+        if progress_callback:
+            progress_callback(total_chunks, total_chunks, "Merging chunk results...")
+    
+    def _annotate_single_chunk(self, chunk_text: str, language: str, nlp, needs: Optional[Set[str]] = None) -> Dict[str, Any]:
         """
         Annotate a single chunk of text (internal method).
         
@@ -849,9 +1275,7 @@ class SpacyService:
             chunk_text: Text chunk to annotate
             language: Language code
             nlp: Loaded SpaCy model
-            progress_callback: Optional callback for progress updates during chunk processing
-            chunk_num: Current chunk number (for progress reporting)
-            total_chunks: Total number of chunks (for progress reporting)
+            needs: Optional subset of ANNOTATION_NEEDS (see annotate_text)
             
         Returns:
             Annotation result for the chunk
@@ -865,53 +1289,11 @@ class SpacyService:
         }
         
         try:
-            # #region agent log
-            chunk_annotate_start = time.time()
-            # #endregion
-            
             # Process with SpaCy - this is the time-consuming part
-            doc = nlp(chunk_text)
-            
-            # Extract tokens with all annotations
-            for token in doc:
-                token_info = {
-                    "text": token.text,
-                    "start": token.idx,
-                    "end": token.idx + len(token.text),
-                    "pos": token.pos_,  # Universal POS tag
-                    "tag": token.tag_,  # Fine-grained POS tag
-                    "lemma": token.lemma_,
-                    "dep": token.dep_,  # Dependency relation
-                    "head": token.head.i,  # Index of head token (relative to chunk)
-                    "morph": str(token.morph) if token.morph else "",
-                    "is_stop": token.is_stop,
-                    "is_punct": token.is_punct,
-                    "is_space": token.is_space
-                }
-                result["tokens"].append(token_info)
-            
-            # Extract named entities
-            for ent in doc.ents:
-                entity_info = {
-                    "text": ent.text,
-                    "start": ent.start_char,
-                    "end": ent.end_char,
-                    "label": ent.label_,
-                    "description": self._get_entity_description(ent.label_)
-                }
-                result["entities"].append(entity_info)
-            
-            # Extract raw sentence boundaries from SpaCy
-            raw_sentences = []
-            for sent in doc.sents:
-                raw_sentences.append({
-                    "text": sent.text,
-                    "start": sent.start_char,
-                    "end": sent.end_char
-                })
+            doc = nlp(chunk_text, disable=get_disabled_components(nlp, needs))
             
-            # Post-process sentences to fix special cases
-            result["sentences"] = post_process_sentences(chunk_text, raw_sentences)
+            # Token indices (including head) are relative to the chunk
+            result.update(self._extract_from_doc(doc, chunk_text, with_sentences=needs is None or "sents" in needs))
             
             result["success"] = True
             
@@ -921,13 +1303,15 @@ class SpacyService:
         
         return result
     
-    def annotate_segments(self, segments: List[Dict], language: str = "english") -> Dict[str, Any]:
+    def annotate_segments(self, segments: List[Dict], language: str = "english", batch_size: int = 32) -> Dict[str, Any]:
         """
-        Annotate transcript segments individually, preserving timestamps
+        Annotate transcript segments individually, preserving timestamps.
+        Segments are streamed through nlp.pipe in batches.
         
         Args:
             segments: List of segment dicts with 'id', 'text', 'start', 'end'
             language: Language code
+            batch_size: Number of segments per nlp.pipe batch
             
         Returns:
             Dictionary with segment-level annotations
@@ -946,14 +1330,12 @@ class SpacyService:
             return result
         
         try:
-            for segment in segments:
+            # Empty segments are skipped before parsing
+            non_empty = [segment for segment in segments if segment.get("text", "").strip()]
+            docs = nlp.pipe((segment["text"] for segment in non_empty), batch_size=batch_size)
+            
+            for segment, doc in zip(non_empty, docs):
                 seg_id = segment.get("id", 0)
-                seg_text = segment.get("text", "")
-                
-                if not seg_text.strip():
-                    continue
-                
-                doc = nlp(seg_text)
                 
                 seg_result = {
                     "segment_start": segment.get("start", 0),
@@ -982,7 +1364,7 @@ class SpacyService:
                         "start": ent.start_char,
                         "end": ent.end_char,
                         "label": ent.label_,
-                        "description": self._get_entity_description(ent.label_)
+                        "description": ENTITY_DESCRIPTIONS.get(ent.label_, ent.label_)
                     })
                 
                 result["segments"][seg_id] = seg_result
@@ -998,6 +1380,19 @@ class SpacyService:
         
         return result
     
+    async def annotate_segments_async(self, segments: List[Dict], language: str = "english") -> Dict[str, Any]:
+        """
+        Run annotate_segments in a worker thread so the event loop stays responsive.
+        
+        Args:
+            segments: List of segment dicts with 'id', 'text', 'start', 'end'
+            language: Language code
+            
+        Returns:
+            Same result as annotate_segments
+        """
+        return await asyncio.to_thread(self.annotate_segments, segments, language)
+    
     def split_into_sentences(self, text: str, language: str = "english") -> List[Dict]:
         """
         Split text into sentences using SpaCy with post-processing for special cases
@@ -1054,56 +1449,28 @@ class SpacyService:
     
     def _get_entity_description(self, label: str) -> str:
         """Get human-readable description for entity label"""
-        descriptions = {
-            # English entities
-            "PERSON": "Person name",
-            "NORP": "Nationalities, religious or political groups",
-            "FAC": "Buildings, airports, highways, bridges, etc.",
-            "ORG": "Organizations, companies, agencies",
-            "GPE": "Countries, cities, states",
-            "LOC": "Non-GPE locations, mountain ranges, bodies of water",
-            "PRODUCT": "Objects, vehicles, foods, etc.",
-            "EVENT": "Named hurricanes, battles, wars, sports events",
-            "WORK_OF_ART": "Titles of books, songs, etc.",
-            "LAW": "Named documents made into laws",
-            "LANGUAGE": "Any named language",
-            "DATE": "Absolute or relative dates or periods",
-            "TIME": "Times smaller than a day",
-            "PERCENT": "Percentage, including %",
-            "MONEY": "Monetary values, including unit",
-            "QUANTITY": "Measurements, as of weight or distance",
-            "ORDINAL": "first, second, etc.",
-            "CARDINAL": "Numerals that do not fall under another type",
-            # Chinese entities
-            "PER": "Person name",
-            "LOC": "Location",
-            "ORG": "Organization",
-            "GPE": "Geo-political entity"
-        }
-        return descriptions.get(label, label)
+        return ENTITY_DESCRIPTIONS.get(label, label)
     
     def get_pos_description(self, pos: str) -> str:
         """Get human-readable description for POS tag"""
-        descriptions = {
-            "ADJ": "Adjective",
-            "ADP": "Adposition",
-            "ADV": "Adverb",
-            "AUX": "Auxiliary verb",
-            "CCONJ": "Coordinating conjunction",
-            "DET": "Determiner",
-            "INTJ": "Interjection",
-            "NOUN": "Noun",
-            "NUM": "Numeral",
-            "PART": "Particle",
-            "PRON": "Pronoun",
-            "PROPN": "Proper noun",
-            "PUNCT": "Punctuation",
-            "SCONJ": "Subordinating conjunction",
-            "SYM": "Symbol",
-            "VERB": "Verb",
-            "X": "Other"
-        }
-        return descriptions.get(pos, pos)
+        return POS_DESCRIPTIONS.get(pos, pos)
+
+
+def save_annotation_json(result: Dict[str, Any], path) -> None:
+    """
+    Write a SpaCy annotation result to a .spacy.json file.
+    Uses orjson when installed (same indented UTF-8 output), otherwise json.dump.
+    
+    Args:
+        result: Annotation result from annotate_text / annotate_text_chunked
+        path: Output file path
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
 
 
 # Singleton instance
@@ -6,14 +6,22 @@ Uses SpaCy annotation data from corpus management
 
 import os
 import json
+import heapq
 import logging
 from typing import List, Dict, Any, Optional, Set
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 import nltk
 from nltk.corpus import wordnet as wn
 
+try:
+    import orjson  # Optional: parses large annotation files several times faster
+except ImportError:
+    orjson = None
+
 from models.database import TextDB, CorpusDB
 
 # Import paths from config module
@@ -27,12 +35,14 @@ logger = logging.getLogger(__name__)
 NLTK_DATA_PATH = MODELS_DIR / "nltk"
 nltk.data.path.insert(0, str(NLTK_DATA_PATH))
 
-# SpaCy POS to WordNet POS mapping
+# SpaCy POS to WordNet POS mapping. Plain literals (the values of wn.ADJ etc.):
+# any attribute access on the lazy `wn` loader loads WordNet, which should
+# happen on first use, not when this module is imported
 SPACY_TO_WORDNET_POS = {
-    'ADJ': wn.ADJ,      # adjective -> 'a'
-    'ADV': wn.ADV,      # adverb -> 'r'
-    'NOUN': wn.NOUN,    # noun -> 'n'
-    'VERB': wn.VERB,    # verb -> 'v'
+    'ADJ': 'a',     # wn.ADJ
+    'ADV': 'r',     # wn.ADV
+    'NOUN': 'n',    # wn.NOUN
+    'VERB': 'v',    # wn.VERB
 }
 
 # POS filter options mapping
@@ -45,14 +55,127 @@ POS_FILTER_OPTIONS = {
     'pronoun': 'PRON',      # Note: WordNet doesn't have pronouns
 }
 
+# POS kept in auto mode: those WordNet supports, plus pronouns (shown without synonyms)
+AUTO_MODE_POS = frozenset(SPACY_TO_WORDNET_POS) | {'PRON'}
+
 # Reverse mapping for display
 WORDNET_TO_DISPLAY_POS = {
-    wn.ADJ: 'adjective',
-    wn.ADV: 'adverb',
-    wn.NOUN: 'noun',
-    wn.VERB: 'verb',
+    'a': 'adjective',
+    'r': 'adverb',
+    'n': 'noun',
+    'v': 'verb',
 }
 
+# Number of annotation files whose word counts are kept in memory between analyses
+ANNOTATION_CACHE_SIZE = 256
+
+# Threads loading annotation files concurrently; texts are loaded in windows of
+# ANNOTATION_LOAD_WINDOW so only a bounded number of parsed files is held at once
+ANNOTATION_LOAD_WORKERS = 8
+ANNOTATION_LOAD_WINDOW = 32
+
+
+def _read_json_file(path: str) -> Any:
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects some input json accepts (NaN, Infinity)
+            return json.loads(raw.decode('utf-8'))
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def extract_tokens(spacy_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract tokens from SpaCy annotation data"""
+    tokens = []
+    
+    if "tokens" in spacy_data:
+        tokens = spacy_data["tokens"]
+    elif "segments" in spacy_data:
+        for seg_id, seg_data in spacy_data["segments"].items():
+            if "tokens" in seg_data:
+                tokens.extend(seg_data["tokens"])
+    
+    return tokens
+
+
+def count_word_tokens(tokens: List[Dict[str, Any]]) -> Counter:
+    """
+    Count word tokens by (lemma, pos), skipping punctuation, spaces and empty text.
+    These checks do not depend on analysis options, so they run once per file.
+    """
+    counts: Counter = Counter()
+    for token in tokens:
+        if token.get('is_punct') or token.get('is_space'):
+            continue
+        
+        word = token.get('text', '').strip()
+        if not word:
+            continue
+        
+        counts[(token.get('lemma', word), token.get('pos', ''))] += 1
+    
+    return counts
+
+
+@lru_cache(maxsize=ANNOTATION_CACHE_SIZE)
+def _count_annotation_words(path: str, mtime_ns: int, size: int, section: Optional[str]) -> Optional[Counter]:
+    data = _read_json_file(path)
+    if section is not None:
+        if section not in data:
+            return None
+        data = data[section]
+    if not data:
+        return Counter()
+    return count_word_tokens(extract_tokens(data))
+
+
+def load_word_counts_cached(path, section: Optional[str] = None) -> Optional[Counter]:
+    """
+    Load the (lemma, pos) word counts of an annotation JSON file.
+    Only the counts are cached, keyed by modification time and size, so
+    re-annotated files are read again. The returned Counter is shared and
+    must not be modified.
+    
+    Args:
+        path: Path to the JSON file
+        section: Optional top-level key holding the annotation
+        
+    Returns:
+        Word counts, or None if the file has no such section
+    """
+    stat = os.stat(path)
+    return _count_annotation_words(str(path), stat.st_mtime_ns, stat.st_size, section)
+
+
+@lru_cache(maxsize=20000)
+def _cached_synsets(word: str, wn_pos: Optional[str]) -> tuple:
+    """
+    Look up WordNet synsets for a word, cached because a few frequent lemmas
+    account for most lookups.
+    
+    Args:
+        word: Word to look up
+        wn_pos: WordNet POS ('n', 'v', 'a', 'r') or None for all POS
+        
+    Returns:
+        Tuple of (name, pos, definition, examples, lemma_names) per synset
+    """
+    synsets = wn.synsets(word, pos=wn_pos) if wn_pos else wn.synsets(word)
+    return tuple(
+        (
+            synset.name(),
+            synset.pos(),
+            synset.definition(),
+            tuple(synset.examples()[:3]),  # Limit examples
+            tuple(lemma.name() for lemma in synset.lemmas())
+        )
+        for synset in synsets
+    )
+
 
 class SynonymService:
     """Synonym analysis service using NLTK WordNet"""
@@ -109,7 +232,7 @@ class SynonymService:
             if text_ids == "all":
                 texts = TextDB.list_by_corpus(corpus_id)
             else:
-                texts = [TextDB.get_by_id(tid) for tid in text_ids if TextDB.get_by_id(tid)]
+                texts = [text for tid in text_ids if (text := TextDB.get_by_id(tid))]
             
             if not texts:
                 return {
@@ -118,10 +241,11 @@ class SynonymService:
                     "results": []
                 }
             
-            # Collect words from SpaCy annotations (separated by POS)
-            word_data = self._collect_words_from_texts(texts, pos_filter, lowercase)
+            # Collect words from SpaCy annotations (separated by POS),
+            # keeping only those that match the search query if provided
+            word_counts = self._collect_words_from_texts(texts, pos_filter, lowercase, search_query)
             
-            if not word_data:
+            if not word_counts:
                 return {
                     "success": True,
                     "results": [],
@@ -129,37 +253,29 @@ class SynonymService:
                     "unique_words": 0
                 }
             
-            # Filter by search query if provided
-            if search_query:
-                query = search_query.lower() if lowercase else search_query
-                word_data = {
-                    key: data for key, data in word_data.items()
-                    if query in key[0].lower()  # key is (word, pos) tuple
-                }
-            
             # Filter by minimum frequency
-            word_data = {
-                key: data for key, data in word_data.items()
-                if data['frequency'] >= min_freq
+            word_counts = {
+                key: count for key, count in word_counts.items()
+                if count >= min_freq
             }
             
-            # Sort by frequency and limit results
-            sorted_words = sorted(
-                word_data.items(),
-                key=lambda x: x[1]['frequency'],
-                reverse=True
-            )[:max_results]
+            # Take the most frequent words (same order as a full descending sort)
+            sorted_words = heapq.nlargest(
+                max_results,
+                word_counts.items(),
+                key=lambda x: x[1]
+            )
             
             # Get synonyms for each word-POS combination
             results = []
-            for (word, pos), data in sorted_words:
+            for (word, pos), frequency in sorted_words:
                 # Get synonyms for this specific POS
                 synonyms_info = self._get_synonyms(word, {pos})
                 # Filter out words with no synonyms (synonym_count == 0)
                 if synonyms_info['synonym_count'] > 0:
                     results.append({
                         "word": word,
-                        "frequency": data['frequency'],
+                        "frequency": frequency,
                         "pos_tags": [pos],  # Single POS per entry
                         "synsets": synonyms_info['synsets'],
                         "all_synonyms": synonyms_info['all_synonyms'],
@@ -169,8 +285,8 @@ class SynonymService:
             return {
                 "success": True,
                 "results": results,
-                "total_words": sum(d['frequency'] for d in word_data.values()),
-                "unique_words": len(word_data)
+                "total_words": sum(word_counts.values()),
+                "unique_words": len(word_counts)
             }
             
         except Exception as e:
@@ -185,71 +301,81 @@ class SynonymService:
         self,
         texts: List[Dict[str, Any]],
         pos_filter: str,
-        lowercase: bool
-    ) -> Dict[tuple, Dict[str, Any]]:
+        lowercase: bool,
+        search_query: Optional[str] = None
+    ) -> Counter:
         """
         Collect words from texts using SpaCy annotations
-        Each word-POS combination is stored separately
+        Each word-POS combination is counted separately
         
         Args:
             texts: List of text entries
             pos_filter: POS filter option
             lowercase: Whether to lowercase words
+            search_query: Optional substring that counted words must contain.
+                Words are compared in lowercase; the query is lowercased only
+                when lowercase is set, so otherwise a query with capitals
+                never matches
             
         Returns:
-            Dictionary mapping (word, pos) tuples to their frequency
+            Counter mapping (word, pos) tuples to their frequency
         """
-        word_data: Dict[tuple, Dict[str, Any]] = {}
+        word_counts: Counter = Counter()
+        query = (search_query.lower() if lowercase else search_query) if search_query else None
         
         # Get target POS from filter
         target_spacy_pos = POS_FILTER_OPTIONS.get(pos_filter)
         
-        for text in texts:
-            spacy_data = self._load_spacy_annotation(text)
-            if not spacy_data:
+        # Resolve the POS filter once into the set of accepted tags (None = any).
+        # For pronouns, we can't use WordNet, but still show them
+        # For auto mode, only include POS that WordNet supports
+        if target_spacy_pos:
+            allowed_pos = frozenset({target_spacy_pos})
+        elif pos_filter == 'auto':
+            allowed_pos = AUTO_MODE_POS
+        else:
+            allowed_pos = None
+        
+        # Punctuation/space filtering is done once per file when its counts are
+        # loaded; here each distinct (lemma, pos) of a text is visited once
+        for text_counts in self._iter_word_counts(texts):
+            if not text_counts:
                 continue
             
-            tokens = self._extract_tokens(spacy_data)
-            
-            for token in tokens:
-                # Skip punctuation and spaces
-                if token.get('is_punct') or token.get('is_space'):
-                    continue
-                
-                word = token.get('text', '').strip()
-                if not word:
-                    continue
-                
-                pos = token.get('pos', '')
-                lemma = token.get('lemma', word)
-                
-                # Apply POS filter
-                if target_spacy_pos and pos != target_spacy_pos:
-                    continue
-                
-                # For pronouns, we can't use WordNet, but still show them
-                # For auto mode, only include POS that WordNet supports
-                if pos_filter == 'auto' and pos not in SPACY_TO_WORDNET_POS and pos != 'PRON':
+            for (lemma, pos), count in text_counts.items():
+                # Apply POS filter first: it rejects most entries with one set lookup
+                if allowed_pos is not None and pos not in allowed_pos:
                     continue
                 
                 # Use lemma for consistency
                 word_key = lemma.lower() if lowercase else lemma
                 
-                # Use (word, pos) as key to separate by POS
-                key = (word_key, pos)
-                
-                if key not in word_data:
-                    word_data[key] = {
-                        'frequency': 0,
-                        'pos_tags': set([pos])  # Single POS per entry
-                    }
+                # Filter by search query before the word enters the counts
+                if query is not None and query not in (word_key if lowercase else word_key.lower()):
+                    continue
                 
-                word_data[key]['frequency'] += 1
+                # Use (word, pos) as key to separate by POS
+                word_counts[(word_key, pos)] += count
+        
+        return word_counts
+    
+    def _iter_word_counts(self, texts: List[Dict[str, Any]]):
+        """
+        Yield the word counts of each text in order (None when missing).
+        Files are read and parsed in a thread pool so disk latency overlaps.
+        """
+        if len(texts) <= 1:
+            for text in texts:
+                yield self._load_word_counts(text)
+            return
         
-        return word_data
+        workers = min(ANNOTATION_LOAD_WORKERS, len(texts))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for i in range(0, len(texts), ANNOTATION_LOAD_WINDOW):
+                yield from pool.map(self._load_word_counts, texts[i:i + ANNOTATION_LOAD_WINDOW])
     
-    def _load_spacy_annotation(self, text: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Load SpaCy annotation for a text"""
+    def _load_word_counts(self, text: Dict[str, Any]) -> Optional[Counter]:
+        """Load (lemma, pos) word counts of a text's SpaCy annotation (cached; do not modify the result)"""
         media_type = text.get('media_type', 'text')
         
         # For audio/video, check transcript JSON first
@@ -257,10 +383,9 @@ class SynonymService:
             transcript_json = text.get('transcript_json_path')
             if transcript_json and os.path.exists(transcript_json):
                 try:
-                    with open(transcript_json, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    if 'spacy_annotations' in data:
-                        return data['spacy_annotations']
+                    counts = load_word_counts_cached(transcript_json, 'spacy_annotations')
+                    if counts is not None:
+                        return counts
                 except Exception as e:
                     logger.warning(f"Failed to load transcript SpaCy: {e}")
         
@@ -274,26 +399,12 @@ class SynonymService:
         
         if spacy_path.exists():
             try:
-                with open(spacy_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return load_word_counts_cached(spacy_path)
             except Exception as e:
                 logger.warning(f"Failed to load SpaCy annotation: {e}")
         
         return None
     
-    def _extract_tokens(self, spacy_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Extract tokens from SpaCy annotation data"""
-        tokens = []
-        
-        if "tokens" in spacy_data:
-            tokens = spacy_data["tokens"]
-        elif "segments" in spacy_data:
-            for seg_id, seg_data in spacy_data["segments"].items():
-                if "tokens" in seg_data:
-                    tokens.extend(seg_data["tokens"])
-        
-        return tokens
-    
     def _get_synonyms(
         self,
         word: str,
@@ -323,33 +434,29 @@ class SynonymService:
             wordnet_pos_list = [None]  # None means all POS
         
         seen_synsets = set()
+        word_lower = word.lower()
         
         for wn_pos in wordnet_pos_list:
             try:
-                if wn_pos:
-                    synsets = wn.synsets(word, pos=wn_pos)
-                else:
-                    synsets = wn.synsets(word)
-                
-                for synset in synsets:
-                    if synset.name() in seen_synsets:
+                for name, synset_pos, definition, examples, lemma_names in _cached_synsets(word, wn_pos):
+                    if name in seen_synsets:
                         continue
-                    seen_synsets.add(synset.name())
+                    seen_synsets.add(name)
                     
                     # Get lemma names (synonyms)
                     synonyms = [
-                        lemma.name().replace('_', ' ')
-                        for lemma in synset.lemmas()
-                        if lemma.name().lower() != word.lower()
+                        lemma_name.replace('_', ' ')
+                        for lemma_name in lemma_names
+                        if lemma_name.lower() != word_lower
                     ]
                     
                     all_synonyms.update(synonyms)
                     
                     synsets_info.append({
-                        "name": synset.name(),
-                        "pos": WORDNET_TO_DISPLAY_POS.get(synset.pos(), synset.pos()),
-                        "definition": synset.definition(),
-                        "examples": synset.examples()[:3],  # Limit examples
+                        "name": name,
+                        "pos": WORDNET_TO_DISPLAY_POS.get(synset_pos, synset_pos),
+                        "definition": definition,
+                        "examples": list(examples),
                         "synonyms": synonyms  # Return all synonyms for each synset
                     })
                     
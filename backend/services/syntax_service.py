@@ -3,9 +3,18 @@ Syntax Analysis Service
 Provides constituency parsing (benepar) and dependency parsing (SpaCy displacy)
 """
 
+import asyncio
+import copy
+import itertools
 import logging
+import queue
 import sys
-from typing import Dict, List, Any, Optional
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from pathlib import Path
 import os
 
@@ -31,24 +40,375 @@ def get_base_path() -> Path:
         return Path(__file__).parent.parent.parent
 
 
+# nltk / spacy objects used while building results. Imported on first use (or
+# in SyntaxService.warmup) so importing this module stays cheap
+_nltk_tree = None
+_displacy = None
+_spacy_span = None
+
+
+def get_nltk_tree():
+    """Get nltk.Tree, importing it on first use"""
+    global _nltk_tree
+    if _nltk_tree is None:
+        from nltk import Tree
+        _nltk_tree = Tree
+    return _nltk_tree
+
+
+def get_displacy():
+    """Get spacy.displacy, importing it on first use"""
+    global _displacy
+    if _displacy is None:
+        from spacy import displacy
+        _displacy = displacy
+    return _displacy
+
+
+def get_spacy_span():
+    """Get spacy.tokens.Span, importing it on first use"""
+    global _spacy_span
+    if _spacy_span is None:
+        from spacy.tokens import Span
+        _spacy_span = Span
+    return _spacy_span
+
+
+# Read size for prefetching model files where readahead hints are unavailable
+PREFETCH_READ_SIZE = 8 * 1024 * 1024
+
+
+def prefetch_model_files(model_dir: Path) -> None:
+    """
+    Ask the OS to read model weight files into the page cache ahead of loading,
+    so a cold start reads them sequentially instead of page fault by page fault.
+    
+    Args:
+        model_dir: Model directory (or single file) to prefetch
+    """
+    files = [model_dir] if model_dir.is_file() else [f for f in model_dir.rglob("*") if f.is_file()]
+    
+    for file_path in files:
+        try:
+            if hasattr(os, "posix_fadvise"):
+                fd = os.open(file_path, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            else:
+                # No readahead hint (Windows/macOS): read the file once instead
+                with open(file_path, "rb") as f:
+                    while f.read(PREFETCH_READ_SIZE):
+                        pass
+        except OSError as e:
+            logger.debug(f"Could not prefetch {file_path}: {e}")
+
+
+# Parse results kept per analysis type
+RESULT_CACHE_SIZE = 512
+
+
+class UncachedResult(Exception):
+    """
+    Raised from a cached analysis to return a failed result without caching
+    it, so transient errors (GPU out of memory, a failed batch) are retried.
+    """
+    
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__(result.get("error"))
+        self.result = result
+
+
+def _raise_unless_successful(analyze):
+    """Wrap an analysis function so only successful results reach lru_cache"""
+    def analyze_successful(*args):
+        result = analyze(*args)
+        if not result["success"]:
+            raise UncachedResult(result)
+        return result
+    return analyze_successful
+
+
+def _build_dependency_options(compact: bool, collapse_punct: bool, collapse_phrases: bool) -> Mapping[str, Any]:
+    """Build displacy options for dependency visualization"""
+    return MappingProxyType({
+        "compact": compact,
+        "collapse_punct": collapse_punct,
+        "collapse_phrases": collapse_phrases,
+        "bg": "transparent",
+        "color": "#333333",
+        "font": "Arial, sans-serif",
+        "distance": 100 if compact else 120,
+        "word_spacing": 30 if compact else 45,
+        "arrow_spacing": 12 if compact else 20,
+        "arrow_width": 8 if compact else 10,
+        "arrow_stroke": 2
+    })
+
+
+# displacy options for every (compact, collapse_punct, collapse_phrases) choice,
+# built once instead of per request (read-only, shared by all requests)
+DEPENDENCY_OPTIONS: Mapping[Tuple[bool, bool, bool], Mapping[str, Any]] = MappingProxyType({
+    flags: _build_dependency_options(*flags)
+    for flags in itertools.product((False, True), repeat=3)
+})
+
+# Token attributes pulled in one Doc.to_array call for dependency results
+# (column order matters)
+DEPENDENCY_ARRAY_ATTRS = ["POS", "TAG", "DEP", "LEMMA", "HEAD"]
+DEPENDENCY_HEAD_COLUMN = DEPENDENCY_ARRAY_ATTRS.index("HEAD")
+
+# Set METALINGO_GPU=1 to run SpaCy/benepar on a CUDA device when one is present.
+# Off by default so packaged builds stay on CPU
+USE_GPU = os.environ.get('METALINGO_GPU') == '1'
+
+# nlp.pipe batch sizes for the batch endpoints (CPU, GPU)
+CONSTITUENCY_BATCH_SIZE = 8
+DEPENDENCY_BATCH_SIZE = 32
+GPU_BATCH_SIZE = 128
+
+# Single-sentence requests parsed concurrently are coalesced into one nlp.pipe
+# call of up to SYNTAX_MAX_BATCH sentences. SYNTAX_BATCH_WAIT_MS lets a batch
+# wait for more requests (trading latency for throughput); by default it only
+# takes the requests already queued, so a lone request is never delayed
+SENTENCE_MAX_BATCH = int(os.environ.get('SYNTAX_MAX_BATCH', 16))
+SENTENCE_BATCH_WAIT = int(os.environ.get('SYNTAX_BATCH_WAIT_MS', 0)) / 1000
+
+# Dependency relation label descriptions
+DEPENDENCY_LABELS: Mapping[str, str] = MappingProxyType({
+    "nsubj": "Nominal subject",
+    "nsubjpass": "Passive nominal subject",
+    "dobj": "Direct object",
+    "iobj": "Indirect object",
+    "csubj": "Clausal subject",
+    "csubjpass": "Passive clausal subject",
+    "ccomp": "Clausal complement",
+    "xcomp": "Open clausal complement",
+    "amod": "Adjectival modifier",
+    "advmod": "Adverbial modifier",
+    "neg": "Negation modifier",
+    "nmod": "Nominal modifier",
+    "appos": "Appositional modifier",
+    "nummod": "Numeric modifier",
+    "compound": "Compound",
+    "det": "Determiner",
+    "case": "Case marking",
+    "mark": "Marker",
+    "cc": "Coordinating conjunction",
+    "conj": "Conjunct",
+    "aux": "Auxiliary",
+    "auxpass": "Passive auxiliary",
+    "cop": "Copula",
+    "punct": "Punctuation",
+    "ROOT": "Root",
+    "prep": "Prepositional modifier",
+    "pobj": "Object of preposition",
+    "poss": "Possession modifier",
+    "attr": "Attribute",
+    "acl": "Adnominal clause",
+    "relcl": "Relative clause modifier",
+    "advcl": "Adverbial clause modifier",
+    "expl": "Expletive",
+    "agent": "Agent",
+    "prt": "Particle",
+    "dep": "Unspecified dependency"
+})
+
+# Constituency phrase label descriptions
+CONSTITUENCY_LABELS: Mapping[str, str] = MappingProxyType({
+    "S": "Simple declarative clause",
+    "SBAR": "Clause introduced by subordinating conjunction",
+    "SBARQ": "Direct question introduced by wh-word",
+    "SINV": "Inverted declarative sentence",
+    "SQ": "Inverted yes/no question",
+    "NP": "Noun Phrase",
+    "VP": "Verb Phrase",
+    "PP": "Prepositional Phrase",
+    "ADJP": "Adjective Phrase",
+    "ADVP": "Adverb Phrase",
+    "QP": "Quantifier Phrase",
+    "CONJP": "Conjunction Phrase",
+    "FRAG": "Fragment",
+    "INTJ": "Interjection",
+    "LST": "List marker",
+    "NAC": "Not a Constituent",
+    "NX": "Head of NP",
+    "PRN": "Parenthetical",
+    "PRT": "Particle",
+    "RRC": "Reduced Relative Clause",
+    "UCP": "Unlike Coordinated Phrase",
+    "WHADJP": "Wh-adjective Phrase",
+    "WHADVP": "Wh-adverb Phrase",
+    "WHNP": "Wh-noun Phrase",
+    "WHPP": "Wh-prepositional Phrase",
+    "X": "Unknown or uncertain constituent"
+})
+
+
+class SentenceBatcher:
+    """
+    Parses sentences submitted from concurrent request threads in shared
+    nlp.pipe batches. A worker thread takes the queued requests (up to
+    max_batch) and parses those for the same pipeline and disabled components
+    in one call, so concurrent requests share the batched forward pass.
+    """
+    
+    def __init__(self, max_batch: int = SENTENCE_MAX_BATCH, max_wait: float = SENTENCE_BATCH_WAIT):
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait)
+        self._queue: "queue.Queue[Tuple[Any, str, Tuple[str, ...], Future]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        # One lock per pipeline: SpaCy/benepar pipelines are not safe to run
+        # from several threads at once (batch endpoints run in worker threads)
+        self._pipeline_locks: Dict[int, threading.Lock] = {}
+    
+    def parse(self, nlp, sentence: str, disable: List[str]):
+        """
+        Parse a sentence as part of the next batch, blocking until it is done.
+        
+        Args:
+            nlp: SpaCy pipeline to parse with
+            sentence: Sentence to parse
+            disable: Pipeline components to skip
+            
+        Returns:
+            Parsed Doc (exceptions from parsing are re-raised)
+        """
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((nlp, sentence, tuple(disable), future))
+        return future.result()
+    
+    def pipeline_lock(self, nlp) -> threading.Lock:
+        """
+        Get the lock held around every use of a pipeline (parsing or adding pipes).
+        
+        Args:
+            nlp: SpaCy pipeline
+            
+        Returns:
+            The pipeline's lock
+        """
+        lock = self._pipeline_locks.get(id(nlp))
+        if lock is None:
+            with self._worker_lock:
+                lock = self._pipeline_locks.setdefault(id(nlp), threading.Lock())
+        return lock
+    
+    def _ensure_worker(self) -> None:
+        """Start the worker thread on first use"""
+        if self._worker is None:
+            with self._worker_lock:
+                if self._worker is None:
+                    worker = threading.Thread(target=self._run, name="syntax-batcher", daemon=True)
+                    worker.start()
+                    self._worker = worker
+    
+    def _next_batch(self) -> List[Tuple[Any, str, Tuple[str, ...], Future]]:
+        """Block for one request, then collect more until max_batch or max_wait"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        
+        while len(batch) < self.max_batch:
+            timeout = deadline - time.monotonic()
+            try:
+                if timeout > 0:
+                    batch.append(self._queue.get(timeout=timeout))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        return batch
+    
+    def _run(self) -> None:
+        """Worker loop: parse queued requests grouped by pipeline and options"""
+        while True:
+            groups: Dict[Tuple[int, Tuple[str, ...]], List[Tuple[Any, str, Tuple[str, ...], Future]]] = {}
+            for item in self._next_batch():
+                groups.setdefault((id(item[0]), item[2]), []).append(item)
+            
+            for items in groups.values():
+                nlp, _, disable, _ = items[0]
+                disable = list(disable)
+                sentences = [sentence for _, sentence, _, _ in items]
+                
+                with self.pipeline_lock(nlp):
+                    try:
+                        docs = list(nlp.pipe(sentences, batch_size=len(items), disable=disable))
+                    except Exception as e:
+                        if len(items) == 1:
+                            items[0][3].set_exception(e)
+                            continue
+                        # Parse one by one so a failing sentence only fails its own request
+                        for sentence, (_, _, _, future) in zip(sentences, items):
+                            try:
+                                future.set_result(nlp(sentence, disable=disable))
+                            except Exception as e:
+                                future.set_exception(e)
+                        continue
+                
+                for (_, _, _, future), doc in zip(items, docs):
+                    future.set_result(doc)
+
+
 class SyntaxService:
     """Syntax analysis service for constituency and dependency parsing"""
     
+    # Components neither analysis uses, left out when loading the models so
+    # their weights are never read or kept in memory
+    EXCLUDED_PIPES = ["ner", "senter"]
+    
+    # Pipeline components each analysis can skip. Dependency output needs the
+    # tagger, parser, attribute_ruler and lemmatizer (POS/tag/lemma/dep);
+    # benepar only needs tokens and sentence boundaries from the parser
+    DEPENDENCY_DISABLED_PIPES = ["benepar"]
+    CONSTITUENCY_DISABLED_PIPES = ["attribute_ruler", "lemmatizer"]
+    
+    # Language codes served by the Chinese pipeline (everything else is English)
+    CHINESE_LANGUAGES = ('chinese', 'zh', 'zh-cn', 'mandarin')
+    
     def __init__(self):
         self.nlp_en = None
         self.nlp_zh = None
         self.benepar_nlp = None
         self._spacy_available = None
         self._benepar_available = None
+        self._gpu_active = None
+        
+        # Successful results per (sentence, options), so repeated requests for
+        # the same sentence (switching views, retries) skip parsing and rendering
+        self._constituency_cached = lru_cache(maxsize=RESULT_CACHE_SIZE)(
+            _raise_unless_successful(self._analyze_constituency)
+        )
+        self._dependency_cached = lru_cache(maxsize=RESULT_CACHE_SIZE)(
+            _raise_unless_successful(self._analyze_dependency)
+        )
+        
+        # Serializes model loading so concurrent requests and the warmup thread
+        # never load the same model twice (reentrant: benepar loads via SpaCy)
+        self._load_lock = threading.RLock()
+        
+        # displacy renderers per thread and option set (renderers keep state
+        # while rendering, so they are not shared between threads)
+        self._renderers = threading.local()
+        
+        # Coalesces single-sentence parses from concurrent requests
+        self._batcher = SentenceBatcher()
         
         # Model paths - support both development and packaged modes
         base_path = get_base_path()
         self.models_dir = base_path / "models"
         self.benepar_model_path = self.models_dir / "nltk" / "models" / "benepar_en3"
+        self._benepar_model_path_str = str(self.benepar_model_path)
+        self._benepar_model_exists = self.benepar_model_path.exists()
         
-        logger.info(f"Syntax service initialized. Base path: {base_path}")
-        logger.info(f"Benepar model path: {self.benepar_model_path}")
-        logger.info(f"Model path exists: {self.benepar_model_path.exists()}")
+        # Lazy %-style arguments: the messages are only formatted if INFO is enabled
+        logger.info("Syntax service initialized. Base path: %s", base_path)
+        logger.info("Benepar model path: %s", self._benepar_model_path_str)
+        logger.info("Model path exists: %s", self._benepar_model_exists)
     
     def _check_spacy(self) -> bool:
         """Check if spacy is available"""
@@ -62,103 +422,169 @@ class SyntaxService:
                 logger.warning("SpaCy is not installed")
         return self._spacy_available
     
+    def _select_device(self) -> bool:
+        """
+        Switch SpaCy to the GPU before the first model load when enabled.
+        
+        Returns:
+            True if models are loaded onto a GPU
+        """
+        if self._gpu_active is None:
+            self._gpu_active = False
+            if USE_GPU and not getattr(sys, 'frozen', False):
+                try:
+                    import spacy
+                    self._gpu_active = spacy.prefer_gpu()
+                except Exception as e:
+                    logger.warning(f"Failed to enable GPU for SpaCy: {e}")
+                logger.info("SpaCy on GPU" if self._gpu_active else "No GPU available, SpaCy on CPU")
+        return self._gpu_active
+    
+    def _batch_size(self, batch_size: Optional[int], cpu_default: int) -> int:
+        """Resolve the nlp.pipe batch size, using larger batches on GPU"""
+        if batch_size is not None:
+            return batch_size
+        return GPU_BATCH_SIZE if self._gpu_active else cpu_default
+    
     def _load_spacy_model(self, language: str):
         """Load SpaCy model for the specified language"""
-        if not self._check_spacy():
-            return None
+        is_chinese = language.lower() in self.CHINESE_LANGUAGES
         
-        import spacy
+        # Fast path once the model is loaded, without taking the lock
+        nlp = self.nlp_zh if is_chinese else self.nlp_en
+        if nlp is not None:
+            return nlp
         
-        lang = language.lower()
+        if not self._check_spacy():
+            return None
         
-        if lang in ['chinese', 'zh', 'zh-cn', 'mandarin']:
-            if self.nlp_zh is None:
-                try:
-                    self.nlp_zh = spacy.load("zh_core_web_lg")
-                    logger.info("Loaded zh_core_web_lg model")
-                except OSError:
+        with self._load_lock:
+            import spacy
+            
+            # Must run before any model is loaded, models stay on their device
+            self._select_device()
+            
+            if is_chinese:
+                if self.nlp_zh is None:
                     try:
-                        self.nlp_zh = spacy.load("zh_core_web_sm")
-                        logger.info("Loaded zh_core_web_sm model (fallback)")
+                        self.nlp_zh = spacy.load("zh_core_web_lg", exclude=self.EXCLUDED_PIPES)
+                        logger.info("Loaded zh_core_web_lg model")
                     except OSError:
-                        logger.error("No Chinese SpaCy model found")
-                        return None
-            return self.nlp_zh
-        else:
-            if self.nlp_en is None:
-                try:
-                    self.nlp_en = spacy.load("en_core_web_lg")
-                    logger.info("Loaded en_core_web_lg model")
-                except OSError:
+                        try:
+                            self.nlp_zh = spacy.load("zh_core_web_sm", exclude=self.EXCLUDED_PIPES)
+                            logger.info("Loaded zh_core_web_sm model (fallback)")
+                        except OSError:
+                            logger.error("No Chinese SpaCy model found")
+                            return None
+                return self.nlp_zh
+            else:
+                if self.nlp_en is None:
                     try:
-                        self.nlp_en = spacy.load("en_core_web_sm")
-                        logger.info("Loaded en_core_web_sm model (fallback)")
+                        self.nlp_en = spacy.load("en_core_web_lg", exclude=self.EXCLUDED_PIPES)
+                        logger.info("Loaded en_core_web_lg model")
                     except OSError:
-                        logger.error("No English SpaCy model found")
-                        return None
-            return self.nlp_en
+                        try:
+                            self.nlp_en = spacy.load("en_core_web_sm", exclude=self.EXCLUDED_PIPES)
+                            logger.info("Loaded en_core_web_sm model (fallback)")
+                        except OSError:
+                            logger.error("No English SpaCy model found")
+                            return None
+                return self.nlp_en
     
     def _load_benepar(self) -> bool:
         """Load benepar constituency parser"""
+        # Fast path once loading has been attempted, without taking the lock
         if self._benepar_available is not None:
             return self._benepar_available
         
-        try:
-            import benepar
-            import spacy
-            
-            # Check if model exists
-            if not self.benepar_model_path.exists():
-                logger.error(f"Benepar model not found at: {self.benepar_model_path}")
-                self._benepar_available = False
-                return False
+        with self._load_lock:
+            if self._benepar_available is not None:
+                return self._benepar_available
             
-            # Load SpaCy model first
             try:
-                nlp = spacy.load("en_core_web_lg")
-            except OSError:
-                try:
-                    nlp = spacy.load("en_core_web_sm")
-                except OSError:
+                import benepar
+                
+                # Check if model exists
+                if not self._benepar_model_exists:
+                    logger.error(f"Benepar model not found at: {self._benepar_model_path_str}")
+                    self._benepar_available = False
+                    return False
+                
+                # Reuse the English pipeline used for dependency parsing instead of
+                # loading a second copy; analyze_dependency skips the benepar pipe
+                nlp = self._load_spacy_model("english")
+                if nlp is None:
                     logger.error("No English SpaCy model found for benepar")
                     self._benepar_available = False
                     return False
-            
-            # Add benepar pipeline
-            if not nlp.has_pipe("benepar"):
-                try:
-                    # Try loading from local path first
-                    model_path_str = str(self.benepar_model_path)
-                    logger.info(f"Attempting to load benepar from: {model_path_str}")
-                    
-                    nlp.add_pipe(
-                        "benepar",
-                        config={"model": model_path_str}
-                    )
-                    logger.info(f"Loaded benepar model from {model_path_str}")
-                except Exception as e:
-                    logger.warning(f"Failed to load from path, trying default model name: {e}")
-                    try:
-                        # Fallback to model name (requires download)
-                        nlp.add_pipe("benepar", config={"model": "benepar_en3"})
-                        logger.info("Loaded benepar_en3 model by name")
-                    except Exception as e2:
-                        logger.error(f"Failed to add benepar pipe: {e2}")
-                        self._benepar_available = False
-                        return False
-            
-            self.benepar_nlp = nlp
-            self._benepar_available = True
-            return True
-            
+                
+                # Add benepar pipeline (the English pipeline may already be parsing
+                # dependency requests, so it is changed under its lock)
+                with self._batcher.pipeline_lock(nlp):
+                    if not nlp.has_pipe("benepar"):
+                        try:
+                            # Try loading from local path first
+                            model_path_str = self._benepar_model_path_str
+                            logger.info(f"Attempting to load benepar from: {model_path_str}")
+                            
+                            nlp.add_pipe(
+                                "benepar",
+                                config={"model": model_path_str}
+                            )
+                            logger.info(f"Loaded benepar model from {model_path_str}")
+                        except Exception as e:
+                            logger.warning(f"Failed to load from path, trying default model name: {e}")
+                            try:
+                                # Fallback to model name (requires download)
+                                nlp.add_pipe("benepar", config={"model": "benepar_en3"})
+                                logger.info("Loaded benepar_en3 model by name")
+                            except Exception as e2:
+                                logger.error(f"Failed to add benepar pipe: {e2}")
+                                self._benepar_available = False
+                                return False
+                
+                self.benepar_nlp = nlp
+                self._benepar_available = True
+                return True
+                
+            except ImportError as e:
+                logger.warning(f"Benepar import error: {e}")
+                self._benepar_available = False
+                return False
+            except Exception as e:
+                logger.error(f"Failed to load benepar: {e}")
+                self._benepar_available = False
+                return False
+    
+    def warmup(self, languages: Tuple[str, ...] = ("english",), constituency: bool = True) -> None:
+        """
+        Preload models so the first analysis request does not pay the load cost.
+        
+        Args:
+            languages: Languages whose SpaCy models should be loaded
+            constituency: Whether to load the benepar constituency parser
+        """
+        # Start reading the benepar weights into the page cache while the
+        # SpaCy models below load, so add_pipe("benepar") finds them there
+        if constituency and self._benepar_available is None and self._benepar_model_exists:
+            threading.Thread(
+                target=prefetch_model_files, args=(self.benepar_model_path,),
+                name="benepar-prefetch", daemon=True
+            ).start()
+        
+        for language in languages:
+            self._load_spacy_model(language)
+        if constituency:
+            self._load_benepar()
+        
+        # Resolve the result-building imports too, off the request path
+        try:
+            get_displacy()
+            get_spacy_span()
+            if constituency:
+                get_nltk_tree()
         except ImportError as e:
-            logger.warning(f"Benepar import error: {e}")
-            self._benepar_available = False
-            return False
-        except Exception as e:
-            logger.error(f"Failed to load benepar: {e}")
-            self._benepar_available = False
-            return False
+            logger.warning(f"Syntax warmup import error: {e}")
     
     def is_constituency_available(self) -> bool:
         """Check if constituency parsing is available"""
@@ -183,6 +609,28 @@ class SyntaxService:
             - tree_data: Hierarchical tree data for visualization
             - error: Error message if any
         """
+        try:
+            # Copied so callers cannot modify the cached result
+            return copy.deepcopy(self._constituency_cached(sentence, language))
+        except UncachedResult as e:
+            return e.result
+    
+    async def analyze_constituency_async(self, sentence: str, language: str = "english") -> Dict[str, Any]:
+        """
+        Run analyze_constituency in a worker thread so the event loop stays
+        responsive and concurrent requests can share parse batches.
+        
+        Args:
+            sentence: Sentence to parse
+            language: Language code (currently only English is supported)
+            
+        Returns:
+            Same result as analyze_constituency
+        """
+        return await asyncio.to_thread(self.analyze_constituency, sentence, language)
+    
+    def _analyze_constituency(self, sentence: str, language: str) -> Dict[str, Any]:
+        """Uncached constituency parsing (see analyze_constituency)"""
         result = {
             "success": False,
             "tree_string": "",
@@ -201,28 +649,8 @@ class SyntaxService:
             return result
         
         try:
-            from nltk import Tree
-            
-            doc = self.benepar_nlp(sentence)
-            
-            for sent in doc.sents:
-                if hasattr(sent._, 'parse_string'):
-                    tree_str = sent._.parse_string
-                    result["tree_string"] = tree_str
-                    
-                    # Parse tree string to get hierarchical data
-                    try:
-                        parse_tree = Tree.fromstring(tree_str)
-                        result["tree_data"] = self._tree_to_dict(parse_tree)
-                    except Exception as e:
-                        logger.warning(f"Failed to convert tree to dict: {e}")
-                        result["tree_data"] = None
-                    
-                    result["success"] = True
-                    break
-            
-            if not result["success"]:
-                result["error"] = "No parse tree generated"
+            doc = self._batcher.parse(self.benepar_nlp, sentence, self.CONSTITUENCY_DISABLED_PIPES)
+            self._fill_constituency_result(result, doc)
                 
         except Exception as e:
             result["error"] = str(e)
@@ -230,28 +658,139 @@ class SyntaxService:
         
         return result
     
+    def analyze_constituency_batch(
+        self,
+        sentences: List[str],
+        language: str = "english",
+        batch_size: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Perform constituency parsing on many sentences in one batched pass
+        
+        Args:
+            sentences: Sentences to parse
+            language: Language code (currently only English is supported)
+            batch_size: Number of sentences per nlp.pipe batch (default depends on device)
+            
+        Returns:
+            One result per sentence, in the same shape as analyze_constituency
+        """
+        results = [{
+            "success": False,
+            "tree_string": "",
+            "tree_data": None,
+            "sentence": sentence,
+            "error": None
+        } for sentence in sentences]
+        
+        error = None
+        if language.lower() not in ['english', 'en']:
+            error = "Constituency parsing currently only supports English"
+        elif not self._load_benepar():
+            error = "Benepar model not available"
+        
+        if error is None:
+            try:
+                batch_size = self._batch_size(batch_size, CONSTITUENCY_BATCH_SIZE)
+                with self._batcher.pipeline_lock(self.benepar_nlp):
+                    docs = self.benepar_nlp.pipe(sentences, batch_size=batch_size, disable=self.CONSTITUENCY_DISABLED_PIPES)
+                    for result, doc in zip(results, docs):
+                        self._fill_constituency_result(result, doc)
+            except Exception as e:
+                error = str(e)
+                logger.error(f"Constituency batch parsing error: {e}")
+        
+        if error is not None:
+            # Sentences not reached by a failed batch are reported as failures
+            for result in results:
+                if not result["success"] and result["error"] is None:
+                    result["error"] = error
+        
+        return results
+    
+    async def analyze_constituency_batch_async(
+        self,
+        sentences: List[str],
+        language: str = "english",
+        batch_size: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run analyze_constituency_batch in a worker thread so the event loop
+        stays responsive while the batch is parsed.
+        
+        Args:
+            sentences: Sentences to parse
+            language: Language code (currently only English is supported)
+            batch_size: Number of sentences per nlp.pipe batch (default depends on device)
+            
+        Returns:
+            Same results as analyze_constituency_batch
+        """
+        return await asyncio.to_thread(self.analyze_constituency_batch, sentences, language, batch_size)
+    
+    def _fill_constituency_result(self, result: Dict[str, Any], doc) -> None:
+        """Fill a constituency result from a Doc parsed by the benepar pipeline"""
+        Tree = get_nltk_tree()
+        
+        # Only the first sentence is reported. Checked with has_extension rather
+        # than hasattr(sent._, ...), which would run benepar's getter twice
+        sent = next(iter(doc.sents), None)
+        if sent is not None and get_spacy_span().has_extension("parse_string"):
+            tree_str = sent._.parse_string
+            result["tree_string"] = tree_str
+            
+            # Parse tree string to get hierarchical data
+            try:
+                parse_tree = Tree.fromstring(tree_str)
+                result["tree_data"] = self._tree_to_dict(parse_tree)
+            except Exception as e:
+                logger.warning(f"Failed to convert tree to dict: {e}")
+                result["tree_data"] = None
+            
+            result["success"] = True
+        
+        if not result["success"]:
+            result["error"] = "No parse tree generated"
+    
     def _tree_to_dict(self, tree) -> Dict[str, Any]:
-        """Convert NLTK Tree to dictionary for JSON serialization"""
-        from nltk import Tree
+        """
+        Convert NLTK Tree to dictionary for JSON serialization.
+        Walks the tree iteratively in post-order and joins each node's text from
+        its children's texts, instead of re-collecting leaves at every level.
+        """
+        Tree = get_nltk_tree()
+        
+        # Converted nodes waiting for their parent, with whether they contain leaves
+        converted: List[Tuple[Dict[str, Any], bool]] = []
+        stack = [(tree, False)]
         
-        if isinstance(tree, Tree):
-            children = []
-            for child in tree:
-                children.append(self._tree_to_dict(child))
+        while stack:
+            node, expanded = stack.pop()
             
-            return {
-                "label": tree.label(),
-                "children": children,
-                "text": " ".join(tree.leaves()) if tree.leaves() else ""
-            }
-        else:
-            # Leaf node (word)
-            return {
-                "label": tree,
-                "children": [],
-                "text": tree,
-                "isLeaf": True
-            }
+            if not isinstance(node, Tree):
+                # Leaf node (word)
+                converted.append(({
+                    "label": node,
+                    "children": [],
+                    "text": node,
+                    "isLeaf": True
+                }, True))
+            elif not expanded:
+                # Visit children first (pushed reversed so they convert in order)
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(node))
+            else:
+                split = len(converted) - len(node)
+                children = converted[split:]
+                del converted[split:]
+                
+                converted.append(({
+                    "label": node.label(),
+                    "children": [child for child, _ in children],
+                    "text": " ".join(child["text"] for child, has_leaves in children if has_leaves)
+                }, any(has_leaves for _, has_leaves in children)))
+        
+        return converted[0][0]
     
     def analyze_dependency(
         self, 
@@ -278,6 +817,49 @@ class SyntaxService:
             - tokens: List of token info with dependency relations
             - error: Error message if any
         """
+        try:
+            # Copied so callers cannot modify the cached result
+            return copy.deepcopy(
+                self._dependency_cached(sentence, language, compact, collapse_punct, collapse_phrases)
+            )
+        except UncachedResult as e:
+            return e.result
+    
+    async def analyze_dependency_async(
+        self,
+        sentence: str,
+        language: str = "english",
+        compact: bool = False,
+        collapse_punct: bool = True,
+        collapse_phrases: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Run analyze_dependency in a worker thread so the event loop stays
+        responsive and concurrent requests can share parse batches.
+        
+        Args:
+            sentence: Sentence to parse
+            language: Language code
+            compact: Use compact mode (straight lines instead of arcs)
+            collapse_punct: Collapse punctuation
+            collapse_phrases: Collapse phrases
+            
+        Returns:
+            Same result as analyze_dependency
+        """
+        return await asyncio.to_thread(
+            self.analyze_dependency, sentence, language, compact, collapse_punct, collapse_phrases
+        )
+    
+    def _analyze_dependency(
+        self,
+        sentence: str,
+        language: str,
+        compact: bool,
+        collapse_punct: bool,
+        collapse_phrases: bool
+    ) -> Dict[str, Any]:
+        """Uncached dependency parsing (see analyze_dependency)"""
         result = {
             "success": False,
             "svg_html": "",
@@ -293,59 +875,12 @@ class SyntaxService:
             return result
         
         try:
-            from spacy import displacy
-            
-            doc = nlp(sentence)
-            
-            # Generate SVG visualization with options
-            options = {
-                "compact": compact,
-                "collapse_punct": collapse_punct,
-                "collapse_phrases": collapse_phrases,
-                "bg": "transparent",
-                "color": "#333333",
-                "font": "Arial, sans-serif",
-                "distance": 100 if compact else 120,
-                "word_spacing": 30 if compact else 45,
-                "arrow_spacing": 12 if compact else 20,
-                "arrow_width": 8 if compact else 10,
-                "arrow_stroke": 2
-            }
-            
-            svg_html = displacy.render(doc, style="dep", options=options)
-            result["svg_html"] = svg_html
-            
-            # Extract token information
-            tokens = []
-            for token in doc:
-                token_info = {
-                    "id": token.i,
-                    "text": token.text,
-                    "lemma": token.lemma_,
-                    "pos": token.pos_,
-                    "tag": token.tag_,
-                    "dep": token.dep_,
-                    "head_id": token.head.i,
-                    "head_text": token.head.text
-                }
-                tokens.append(token_info)
-            
-            result["tokens"] = tokens
-            
-            # Extract arcs (dependency relations)
-            arcs = []
-            for token in doc:
-                if token.dep_ != "ROOT":
-                    arc = {
-                        "start": min(token.i, token.head.i),
-                        "end": max(token.i, token.head.i),
-                        "label": token.dep_,
-                        "dir": "left" if token.i < token.head.i else "right"
-                    }
-                    arcs.append(arc)
-            
-            result["arcs"] = arcs
-            result["success"] = True
+            # The English pipeline is shared with constituency parsing, so the
+            # benepar pipe is skipped here
+            doc = self._batcher.parse(nlp, sentence, self.DEPENDENCY_DISABLED_PIPES)
+            self._fill_dependency_result(
+                result, doc, self._dependency_options(compact, collapse_punct, collapse_phrases)
+            )
             
         except Exception as e:
             result["error"] = str(e)
@@ -353,86 +888,188 @@ class SyntaxService:
         
         return result
     
-    def get_dependency_labels(self) -> Dict[str, str]:
-        """Get dependency relation label descriptions"""
-        return {
-            "nsubj": "Nominal subject",
-            "nsubjpass": "Passive nominal subject",
-            "dobj": "Direct object",
-            "iobj": "Indirect object",
-            "csubj": "Clausal subject",
-            "csubjpass": "Passive clausal subject",
-            "ccomp": "Clausal complement",
-            "xcomp": "Open clausal complement",
-            "amod": "Adjectival modifier",
-            "advmod": "Adverbial modifier",
-            "neg": "Negation modifier",
-            "nmod": "Nominal modifier",
-            "appos": "Appositional modifier",
-            "nummod": "Numeric modifier",
-            "compound": "Compound",
-            "det": "Determiner",
-            "case": "Case marking",
-            "mark": "Marker",
-            "cc": "Coordinating conjunction",
-            "conj": "Conjunct",
-            "aux": "Auxiliary",
-            "auxpass": "Passive auxiliary",
-            "cop": "Copula",
-            "punct": "Punctuation",
-            "ROOT": "Root",
-            "prep": "Prepositional modifier",
-            "pobj": "Object of preposition",
-            "poss": "Possession modifier",
-            "attr": "Attribute",
-            "acl": "Adnominal clause",
-            "relcl": "Relative clause modifier",
-            "advcl": "Adverbial clause modifier",
-            "expl": "Expletive",
-            "agent": "Agent",
-            "prt": "Particle",
-            "dep": "Unspecified dependency"
-        }
+    def analyze_dependency_batch(
+        self,
+        sentences: List[str],
+        language: str = "english",
+        compact: bool = False,
+        collapse_punct: bool = True,
+        collapse_phrases: bool = False,
+        batch_size: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Perform dependency parsing on many sentences in one batched pass
+        
+        Args:
+            sentences: Sentences to parse
+            language: Language code
+            compact: Use compact mode (straight lines instead of arcs)
+            collapse_punct: Collapse punctuation
+            collapse_phrases: Collapse phrases
+            batch_size: Number of sentences per nlp.pipe batch (default depends on device)
+            
+        Returns:
+            One result per sentence, in the same shape as analyze_dependency
+        """
+        results = [{
+            "success": False,
+            "svg_html": "",
+            "tokens": [],
+            "arcs": [],
+            "sentence": sentence,
+            "error": None
+        } for sentence in sentences]
+        
+        error = None
+        nlp = self._load_spacy_model(language)
+        if nlp is None:
+            error = f"SpaCy model not available for {language}"
+        else:
+            try:
+                options = self._dependency_options(compact, collapse_punct, collapse_phrases)
+                batch_size = self._batch_size(batch_size, DEPENDENCY_BATCH_SIZE)
+                with self._batcher.pipeline_lock(nlp):
+                    docs = nlp.pipe(sentences, batch_size=batch_size, disable=self.DEPENDENCY_DISABLED_PIPES)
+                    for result, doc in zip(results, docs):
+                        self._fill_dependency_result(result, doc, options)
+            except Exception as e:
+                error = str(e)
+                logger.error(f"Dependency batch parsing error: {e}")
+        
+        if error is not None:
+            # Sentences not reached by a failed batch are reported as failures
+            for result in results:
+                if not result["success"] and result["error"] is None:
+                    result["error"] = error
+        
+        return results
     
-    def get_constituency_labels(self) -> Dict[str, str]:
-        """Get constituency phrase label descriptions"""
-        return {
-            "S": "Simple declarative clause",
-            "SBAR": "Clause introduced by subordinating conjunction",
-            "SBARQ": "Direct question introduced by wh-word",
-            "SINV": "Inverted declarative sentence",
-            "SQ": "Inverted yes/no question",
-            "NP": "Noun Phrase",
-            "VP": "Verb Phrase",
-            "PP": "Prepositional Phrase",
-            "ADJP": "Adjective Phrase",
-            "ADVP": "Adverb Phrase",
-            "QP": "Quantifier Phrase",
-            "CONJP": "Conjunction Phrase",
-            "FRAG": "Fragment",
-            "INTJ": "Interjection",
-            "LST": "List marker",
-            "NAC": "Not a Constituent",
-            "NX": "Head of NP",
-            "PRN": "Parenthetical",
-            "PRT": "Particle",
-            "RRC": "Reduced Relative Clause",
-            "UCP": "Unlike Coordinated Phrase",
-            "WHADJP": "Wh-adjective Phrase",
-            "WHADVP": "Wh-adverb Phrase",
-            "WHNP": "Wh-noun Phrase",
-            "WHPP": "Wh-prepositional Phrase",
-            "X": "Unknown or uncertain constituent"
-        }
+    async def analyze_dependency_batch_async(
+        self,
+        sentences: List[str],
+        language: str = "english",
+        compact: bool = False,
+        collapse_punct: bool = True,
+        collapse_phrases: bool = False,
+        batch_size: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run analyze_dependency_batch in a worker thread so the event loop
+        stays responsive while the batch is parsed.
+        
+        Args:
+            sentences: Sentences to parse
+            language: Language code
+            compact: Use compact mode (straight lines instead of arcs)
+            collapse_punct: Collapse punctuation
+            collapse_phrases: Collapse phrases
+            batch_size: Number of sentences per nlp.pipe batch (default depends on device)
+            
+        Returns:
+            Same results as analyze_dependency_batch
+        """
+        return await asyncio.to_thread(
+            self.analyze_dependency_batch,
+            sentences, language, compact, collapse_punct, collapse_phrases, batch_size
+        )
+    
+    def _dependency_options(self, compact: bool, collapse_punct: bool, collapse_phrases: bool) -> Mapping[str, Any]:
+        """Get displacy options for dependency visualization"""
+        return DEPENDENCY_OPTIONS[(bool(compact), bool(collapse_punct), bool(collapse_phrases))]
+    
+    def _fill_dependency_result(self, result: Dict[str, Any], doc, options: Mapping[str, Any]) -> None:
+        """Fill a dependency result (SVG, tokens, arcs) from a parsed Doc"""
+        # Generate SVG visualization with options
+        result["svg_html"] = self._render_dependency_svg(doc, options)
+        
+        # Label and head columns are copied out in one to_array call instead of
+        # one Cython attribute lookup per label per token. Labels come back as
+        # string-store hashes and HEAD as an offset from the token, stored unsigned
+        array = doc.to_array(DEPENDENCY_ARRAY_ATTRS)
+        pos_ids, tag_ids, dep_ids, lemma_ids, _ = array.T.tolist()
+        head_offsets = array[:, DEPENDENCY_HEAD_COLUMN].astype("int64").tolist()
+        texts = [token.text for token in doc]
+        
+        # Resolve each distinct hash once: labels repeat across the sentence, so
+        # tokens share one str object per label instead of decoding a new one
+        strings = doc.vocab.strings
+        names = {h: strings[h] for h in set(pos_ids).union(tag_ids, dep_ids, lemma_ids)}
+        
+        # Extract token information and arcs (dependency relations) in one pass
+        tokens = []
+        arcs = []
+        for i, text in enumerate(texts):
+            dep = names[dep_ids[i]]
+            head_id = i + head_offsets[i]
+            
+            tokens.append({
+                "id": i,
+                "text": text,
+                "lemma": names[lemma_ids[i]],
+                "pos": names[pos_ids[i]],
+                "tag": names[tag_ids[i]],
+                "dep": dep,
+                "head_id": head_id,
+                "head_text": texts[head_id]
+            })
+            
+            if dep != "ROOT":
+                arcs.append({
+                    "start": min(i, head_id),
+                    "end": max(i, head_id),
+                    "label": dep,
+                    "dir": "left" if i < head_id else "right"
+                })
+        
+        result["tokens"] = tokens
+        result["arcs"] = arcs
+        result["success"] = True
+    
+    def _render_dependency_svg(self, doc, options: Mapping[str, Any]) -> str:
+        """
+        Render the displacy dependency SVG for a Doc.
+        Same output as displacy.render(doc, style="dep", options=options), but
+        reuses one renderer per option set instead of building one per call.
+        """
+        displacy = get_displacy()
+        
+        renderers = getattr(self._renderers, "by_options", None)
+        if renderers is None:
+            renderers = self._renderers.by_options = {}
+        
+        # The flags are the only options that vary (see DEPENDENCY_OPTIONS)
+        key = (options["compact"], options["collapse_punct"], options["collapse_phrases"])
+        renderer = renderers.get(key)
+        if renderer is None:
+            renderer = renderers[key] = displacy.DependencyRenderer(options=options)
+        
+        return renderer.render([displacy.parse_deps(doc, options)]).strip()
+    
+    def get_dependency_labels(self) -> Mapping[str, str]:
+        """Get dependency relation label descriptions (shared, read-only)"""
+        return DEPENDENCY_LABELS
+    
+    def get_constituency_labels(self) -> Mapping[str, str]:
+        """Get constituency phrase label descriptions (shared, read-only)"""
+        return CONSTITUENCY_LABELS
 
 
 # Singleton instance
 _syntax_service = None
+_syntax_service_lock = threading.Lock()
 
 
 def get_syntax_service() -> SyntaxService:
     """Get syntax service singleton"""
     global _syntax_service
     if _syntax_service is None:
-        _syntax_service = SyntaxService()
+        with _syntax_service_lock:
+            # Checked again under the lock so concurrent first requests create
+            # (and warm up) only one service
+            if _syntax_service is None:
+                service = SyntaxService()
+                # Load the English models in the background; requests arriving meanwhile
+                # wait on the load lock instead of loading a second copy
+                threading.Thread(target=service.warmup, name="syntax-warmup", daemon=True).start()
+                _syntax_service = service
     return _syntax_service
@@ -3,10 +3,16 @@ BERTopic Analysis Service
 Core topic modeling with configurable dimensionality reduction, clustering, and vectorization
 """
 
+import copy
+import hashlib
+import importlib
 import logging
 import os
 import time
 import pickle
+import threading
+from collections import Counter
+from functools import lru_cache
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Any, Optional, Tuple
@@ -18,10 +24,123 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from config import DATA_DIR, MODELS_DIR, TOPIC_MODELING_DIR
 
+try:
+    import orjson  # Optional: much faster serialization of large result files
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
-# Fixed SBERT model path for topic representation
-SBERT_MODEL_PATH = MODELS_DIR / "sentence_embeddings" / "paraphrase-multilingual-MiniLM-L12-v2"
+# With accelerator 'cuda', UMAP/HDBSCAN run on the GPU through cuML for corpora
+# at least this large (smaller ones are faster on CPU than the GPU transfer)
+GPU_MIN_DOCUMENTS = 5000
+
+# UMAP computes exact distances for fewer points than this and only runs the
+# (cacheable) approximate nearest-neighbor search for larger corpora
+KNN_CACHE_MIN_DOCUMENTS = 4096
+
+
+def load_cuml_class(module_name: str, class_name: str):
+    """
+    Get a cuML (GPU) model class, if cuML is installed.
+    
+    Args:
+        module_name: cuML module, e.g. 'cuml.manifold'
+        class_name: Class in that module, e.g. 'UMAP'
+        
+    Returns:
+        The class, or None when cuML is not available
+    """
+    try:
+        return getattr(importlib.import_module(module_name), class_name)
+    except ImportError:
+        logger.warning(f"cuML not available, using CPU {class_name}")
+        return None
+
+
+# HDBSCAN variant for the cosine metric (module-level so fitted models pickle)
+try:
+    from hdbscan import HDBSCAN
+    from sklearn.preprocessing import normalize
+    
+    class _NormalizedQueries:
+        """
+        Wraps the tree or distance metric in CosineHDBSCAN's prediction data so
+        query points are L2-normalized like the points the model was fitted on
+        """
+        
+        def __init__(self, wrapped):
+            self._wrapped = wrapped
+        
+        def query(self, X, *args, **kwargs):
+            return self._wrapped.query(normalize(np.atleast_2d(X)), *args, **kwargs)
+        
+        def pairwise(self, X, *args, **kwargs):
+            return self._wrapped.pairwise(normalize(np.atleast_2d(X)), *args, **kwargs)
+        
+        def __getattr__(self, name):
+            return getattr(self._wrapped, name)
+    
+    class CosineHDBSCAN(HDBSCAN):
+        """
+        HDBSCAN clustering by cosine direction: points are L2-normalized before
+        fitting with the euclidean metric, so HDBSCAN can use its KD-tree
+        algorithms (and prediction data) instead of calling a Python distance
+        function for every pair of points.
+        
+        On unit vectors ||a - b|| = sqrt(2 * cosine distance). That keeps the
+        neighbour order, the minimum spanning tree and the merge order of the
+        hierarchy, but it is not a linear rescaling: EOM cluster stabilities sum
+        lambda = 1 / distance, so the selected clusters and probabilities can
+        differ from HDBSCAN with metric='cosine'.
+        
+        New points given to hdbscan's prediction functions (approximate_predict,
+        membership_vector, as used by BERTopic.transform) are normalized too:
+        prediction_data_ wraps the nearest-neighbor tree and distance metric.
+        """
+        
+        def fit(self, X, y=None, **kwargs):
+            return super().fit(normalize(X), y, **kwargs)
+        
+        @property
+        def prediction_data_(self):
+            prediction_data = super().prediction_data_
+            cached = self.__dict__.get('_normalized_prediction_data')
+            if cached is None or cached[0] is not prediction_data:
+                normalized = copy.copy(prediction_data)
+                normalized.tree = _NormalizedQueries(prediction_data.tree)
+                normalized.dist_metric = _NormalizedQueries(prediction_data.dist_metric)
+                cached = (prediction_data, normalized)
+                self._normalized_prediction_data = cached
+            return cached[1]
+        
+        def __getstate__(self):
+            # The wrapped view is rebuilt on first use after loading
+            state = super().__getstate__()
+            state.pop('_normalized_prediction_data', None)
+            return state
+except ImportError:
+    CosineHDBSCAN = None
+
+
+@lru_cache(maxsize=None)
+def _cut_chinese_piece(piece: str) -> Tuple[str, ...]:
+    """Tokens of one whitespace-free piece of text (cleared after each analysis)"""
+    import jieba
+    
+    return tuple(token for token in jieba.cut(piece) if len(token.strip()) > 1)
+
+
+def chinese_tokenizer(text: str) -> List[str]:
+    """
+    Tokenize Chinese text using jieba, dropping single characters and whitespace.
+    Module-level (not a closure) so fitted vectorizers holding it can be pickled.
+    
+    BERTopic vectorizes the same documents several times (c-TF-IDF fit, outlier
+    update, topics over time), each time joined per topic with spaces. jieba
+    never cuts across whitespace, so each piece is cut once and reused.
+    """
+    return [token for piece in text.split() for token in _cut_chinese_piece(piece)]
 
 
 class BERTopicService:
@@ -32,30 +151,40 @@ class BERTopicService:
         self.results_dir = TOPIC_MODELING_DIR / "results"
         self.results_dir.mkdir(parents=True, exist_ok=True)
         self._embedding_model = None
+        self._jieba_preload = None
+        # Nearest-neighbor graph of the last UMAP fit, keyed by embeddings and
+        # kNN parameters: re-running with other UMAP/HDBSCAN settings on the
+        # same embeddings skips the nearest-neighbor search
+        self._knn_cache: Dict[tuple, tuple] = {}
     
     def _load_embedding_model(self):
-        """Lazy load the SBERT model for topic representation"""
+        """
+        Lazy load the SBERT model for topic representation. Reuses the embedding
+        service's model (same SBERT_MODEL_PATH), which is usually already loaded
+        from creating the document embeddings, instead of loading a second copy.
+        """
         if self._embedding_model is not None:
             return self._embedding_model
         
-        try:
-            from sentence_transformers import SentenceTransformer
-            
-            if not SBERT_MODEL_PATH.exists():
-                raise ValueError(f"SBERT model not found at {SBERT_MODEL_PATH}")
-            
-            logger.info(f"Loading SBERT model for topic representation")
-            self._embedding_model = SentenceTransformer(str(SBERT_MODEL_PATH))
-            return self._embedding_model
-            
-        except ImportError:
-            raise ImportError("sentence-transformers not installed")
+        from .embedding_service import get_topic_embedding_service
+        
+        logger.info("Using shared SBERT model for topic representation")
+        self._embedding_model = get_topic_embedding_service().get_model()
+        return self._embedding_model
     
-    def _create_dim_reduction_model(self, method: str, params: Dict[str, Any]):
-        """Create dimensionality reduction model"""
+    def _create_dim_reduction_model(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        use_gpu: bool = False,
+        embeddings: Optional[np.ndarray] = None
+    ):
+        """
+        Create dimensionality reduction model (cuML on GPU when use_gpu).
+        When the embeddings are given, a CPU UMAP gets their (cached)
+        nearest-neighbor graph as precomputed_knn.
+        """
         if method == "UMAP":
-            from umap import UMAP
-            
             default_params = {
                 'n_neighbors': 15,
                 'n_components': 5,
@@ -66,6 +195,20 @@ class BERTopicService:
             }
             default_params.update(params)
             
+            if use_gpu:
+                gpu_umap = load_cuml_class('cuml.manifold', 'UMAP')
+                if gpu_umap is not None:
+                    # low_memory only applies to umap-learn's nearest-neighbour descent
+                    default_params.pop('low_memory', None)
+                    return gpu_umap(**default_params)
+            
+            from umap import UMAP
+            
+            if embeddings is not None and 'precomputed_knn' not in default_params:
+                precomputed_knn = self._get_precomputed_knn(embeddings, default_params)
+                if precomputed_knn is not None:
+                    default_params['precomputed_knn'] = precomputed_knn
+            
             return UMAP(**default_params)
         
         elif method == "PCA":
@@ -84,11 +227,78 @@ class BERTopicService:
         else:
             raise ValueError(f"Unknown dimensionality reduction method: {method}")
     
-    def _create_clustering_model(self, method: str, params: Dict[str, Any], calculate_probabilities: bool = False):
-        """Create clustering model"""
+    def _get_precomputed_knn(self, embeddings: np.ndarray, umap_params: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Get the nearest-neighbor graph UMAP would compute for these embeddings,
+        from the cache when the same embeddings and kNN parameters were used
+        by the previous analysis.
+        
+        Args:
+            embeddings: Contiguous document embeddings
+            umap_params: Resolved UMAP parameters
+            
+        Returns:
+            (knn_indices, knn_dists, knn_search_index) for UMAP's precomputed_knn,
+            or None when UMAP should search itself (small corpora, custom metrics)
+        """
+        metric = umap_params.get('metric', 'euclidean')
+        if (
+            len(embeddings) < KNN_CACHE_MIN_DOCUMENTS
+            or not isinstance(metric, str)
+            or umap_params.get('metric_kwds')
+        ):
+            return None
+        
+        from sklearn.utils import check_random_state
+        from umap.umap_ import nearest_neighbors
+        
+        n_neighbors = int(umap_params.get('n_neighbors', 15))
+        random_state = umap_params.get('random_state')
+        low_memory = umap_params.get('low_memory', True)
+        digest = hashlib.blake2b(embeddings, digest_size=16).hexdigest()
+        key = (digest, embeddings.shape, n_neighbors, metric, random_state, low_memory)
+        
+        knn = self._knn_cache.get(key)
+        if knn is not None:
+            logger.info(f"Reusing cached nearest-neighbor graph (n_neighbors={n_neighbors}, metric={metric})")
+            return knn
+        
+        logger.info(f"Computing nearest-neighbor graph (n_neighbors={n_neighbors}, metric={metric})")
+        knn_start = time.time()
+        # Same arguments UMAP passes internally (it also runs single-threaded when
+        # seeded), but with a generator of its own. UMAP normally reuses one
+        # RandomState for the graph and then the layout; with a precomputed graph
+        # its generator starts the layout unadvanced. Seeded analyses of
+        # KNN_CACHE_MIN_DOCUMENTS+ documents are still reproducible run to run
+        # (cached or not), but differ from the layout UMAP's own search gives
+        knn = nearest_neighbors(
+            embeddings,
+            n_neighbors,
+            metric,
+            {},
+            umap_params.get('angular_rp_forest', False),
+            check_random_state(random_state),
+            low_memory=low_memory,
+            n_jobs=1 if random_state is not None else umap_params.get('n_jobs', -1),
+            verbose=False
+        )
+        logger.info(f"Nearest-neighbor graph computed in {time.time() - knn_start:.2f}s")
+        
+        # Keep only the latest graph; its search index references the embeddings
+        self._knn_cache.clear()
+        self._knn_cache[key] = knn
+        return knn
+    
+    def _create_clustering_model(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        calculate_probabilities: bool = False,
+        use_gpu: bool = False
+    ):
+        """Create clustering model (cuML HDBSCAN on GPU when use_gpu)"""
         if method == "HDBSCAN":
             from hdbscan import HDBSCAN
-            from sklearn.metrics.pairwise import cosine_distances
             
             # Only use valid HDBSCAN parameters
             valid_hdbscan_params = {
@@ -111,14 +321,21 @@ class BERTopicService:
             
             logger.info(f"HDBSCAN params: {valid_hdbscan_params}")
             
-            # Handle cosine metric
-            if valid_hdbscan_params.get('metric') == 'cosine':
-                valid_hdbscan_params['metric'] = cosine_distances
-            
             # Enable probability calculation if needed
             if calculate_probabilities:
                 valid_hdbscan_params['prediction_data'] = True
             
+            # cuML's HDBSCAN only implements the euclidean metric
+            if use_gpu and valid_hdbscan_params.get('metric') == 'euclidean':
+                gpu_hdbscan = load_cuml_class('cuml.cluster', 'HDBSCAN')
+                if gpu_hdbscan is not None:
+                    return gpu_hdbscan(**valid_hdbscan_params)
+            
+            # Handle cosine metric: euclidean distance on normalized points
+            if valid_hdbscan_params.get('metric') == 'cosine':
+                valid_hdbscan_params['metric'] = 'euclidean'
+                return CosineHDBSCAN(**valid_hdbscan_params)
+            
             return HDBSCAN(**valid_hdbscan_params)
         
         elif method == "BIRCH":
@@ -151,13 +368,21 @@ class BERTopicService:
         else:
             raise ValueError(f"Unknown clustering method: {method}")
     
-    def _create_vectorizer_model(self, vectorizer_type: str, params: Dict[str, Any], language: str = 'english'):
+    def _create_vectorizer_model(
+        self,
+        vectorizer_type: str,
+        params: Dict[str, Any],
+        language: str = 'english',
+        lowercased: bool = False
+    ):
         """Create vectorizer model with language-aware tokenization
         
         Args:
             vectorizer_type: CountVectorizer or TfidfVectorizer
             params: Vectorizer parameters
             language: Corpus language (chinese/english/etc.)
+            lowercased: Documents are already lowercased, skip the vectorizer's
+                own lowercasing pass
         """
         from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
         
@@ -169,6 +394,16 @@ class BERTopicService:
         }
         default_params.update(params)
         
+        # Narrower matrix dtypes: int32 term counts (int64 by default) and
+        # float32 tf-idf weights (float64) halve the document-term matrix
+        # that c-TF-IDF is computed from
+        if vectorizer_type == "CountVectorizer":
+            default_params.setdefault('dtype', np.int32)
+        elif vectorizer_type == "TfidfVectorizer":
+            default_params.setdefault('dtype', np.float32)
+        if lowercased:
+            default_params.setdefault('lowercase', False)
+        
         # FIX: max_df=1 (int) means "appear in exactly 1 doc", not "100%"
         # Convert integer 1 to float 1.0 to mean "100% of documents"
         if default_params.get('max_df') == 1 and isinstance(default_params.get('max_df'), int):
@@ -200,17 +435,21 @@ class BERTopicService:
     
     def _get_chinese_tokenizer(self):
         """Get jieba tokenizer function for Chinese text"""
-        import jieba
-        
-        def chinese_tokenizer(text):
-            """Tokenize Chinese text using jieba"""
-            # Use jieba cut for word segmentation
-            tokens = jieba.lcut(text)
-            # Filter out single characters and whitespace
-            return [token for token in tokens if len(token.strip()) > 1]
-        
+        self._preload_jieba()
         return chinese_tokenizer
     
+    def _preload_jieba(self):
+        """
+        Load jieba's dictionary in a background thread (once per service), so it
+        overlaps with dimensionality reduction and clustering instead of
+        stalling the first tokenized document. jieba.cut waits for it if needed.
+        """
+        if self._jieba_preload is None:
+            import jieba
+            
+            self._jieba_preload = threading.Thread(target=jieba.initialize, name="jieba-preload", daemon=True)
+            self._jieba_preload.start()
+    
     def _load_chinese_stopwords(self) -> list:
         """Load Chinese stopwords from NLTK data"""
         stopwords_file = MODELS_DIR / "nltk" / "corpora" / "stopwords" / "chinese"
@@ -311,6 +550,7 @@ class BERTopicService:
                 - representation_model: {type, params}
                 - reduce_outliers: {enabled, strategy, threshold}
                 - calculate_probabilities: bool
+                - accelerator: 'cpu' (default) or 'cuda' (cuML UMAP/HDBSCAN for large corpora)
             timestamps: Optional list of timestamps for dynamic topic analysis
             dynamic_config: Optional dynamic topic configuration
                 - nr_bins: number of time bins
@@ -323,9 +563,19 @@ class BERTopicService:
         """
         from bertopic import BERTopic
         
+        # Drop tokenizations left over from a failed analysis
+        _cut_chinese_piece.cache_clear()
+        
         logger.info(f"Starting BERTopic analysis on {len(documents)} documents (language: {language})")
         start_time = time.time()
         
+        # UMAP's nearest-neighbor search streams the embeddings many times;
+        # float64 or strided input would be copy-cast inside it (embeddings
+        # from older files or other callers)
+        if embeddings.dtype != np.float32 or not embeddings.flags['C_CONTIGUOUS']:
+            embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+            logger.info("Converted embeddings to contiguous float32")
+        
         # Extract config
         dim_config = config.get('dim_reduction', {'method': 'UMAP', 'params': {}})
         cluster_config = config.get('clustering', {'method': 'HDBSCAN', 'params': {}})
@@ -333,6 +583,7 @@ class BERTopicService:
         repr_config = config.get('representation_model', {})
         outlier_config = config.get('reduce_outliers', {'enabled': False})
         calculate_probs = config.get('calculate_probabilities', False)
+        use_gpu = config.get('accelerator') == 'cuda' and len(documents) >= GPU_MIN_DOCUMENTS
         
         # Debug: Log outlier config
         logger.info(f"Outlier config received: {outlier_config}")
@@ -340,20 +591,24 @@ class BERTopicService:
         # Create models
         dim_model = self._create_dim_reduction_model(
             dim_config.get('method', 'UMAP'),
-            dim_config.get('params', {})
+            dim_config.get('params', {}),
+            use_gpu=use_gpu,
+            embeddings=embeddings
         )
         
         cluster_model = self._create_clustering_model(
             cluster_config.get('method', 'HDBSCAN'),
             cluster_config.get('params', {}),
-            calculate_probs or (outlier_config.get('enabled') and outlier_config.get('strategy') == 'probabilities')
+            calculate_probs or (outlier_config.get('enabled') and outlier_config.get('strategy') == 'probabilities'),
+            use_gpu=use_gpu
         )
         
         # Create vectorizer with language-aware tokenization
         vectorizer_model = self._create_vectorizer_model(
             vec_config.get('type', 'CountVectorizer'),
             vec_config.get('params', {}),
-            language=language
+            language=language,
+            lowercased=vec_config.get('lowercased', False)
         )
         
         representation_model = None
@@ -395,7 +650,7 @@ class BERTopicService:
         logger.info(f"Outlier reduction enabled: {outlier_config.get('enabled', False)}, strategy: {outlier_config.get('strategy')}, threshold: {outlier_config.get('threshold')}")
         if outlier_config.get('enabled', False):
             logger.info("Reducing outliers...")
-            original_outliers = sum(1 for t in topics if t == -1)
+            original_outliers = int(np.count_nonzero(np.asarray(topics) == -1))
             
             new_topics = topic_model.reduce_outliers(
                 documents,
@@ -407,36 +662,45 @@ class BERTopicService:
             )
             
             topic_model.topics_ = new_topics
-            topic_model.update_topics(documents, topics=new_topics)
+            if outlier_config.get('update_topic_representations', True):
+                topic_model.update_topics(documents, topics=new_topics)
+            else:
+                # Keep the keywords from fitting and skip update_topics, which
+                # re-vectorizes every document and recomputes c-TF-IDF; only the
+                # topic sizes shown in topic_info change
+                topic_model.topic_sizes_ = Counter(new_topics)
             topics = new_topics
             topic_info = topic_model.get_topic_info()
             
-            new_outliers = sum(1 for t in topics if t == -1)
+            new_outliers = int(np.count_nonzero(np.asarray(topics) == -1))
             logger.info(f"Outliers reduced from {original_outliers} to {new_outliers}")
         
         # Dynamic topic analysis (topics over time)
         topics_over_time_data = None
         if timestamps is not None and len(timestamps) == len(documents):
             # Filter out documents without valid timestamps (timestamp <= 0 means no date)
-            valid_indices = [i for i, t in enumerate(timestamps) if t > 0]
-            valid_timestamps_days = [timestamps[i] for i in valid_indices]
-            valid_documents = [documents[i] for i in valid_indices]
+            timestamps_arr = np.asarray(timestamps, dtype=np.int64)
+            valid_mask = timestamps_arr > 0
+            valid_timestamps_arr = timestamps_arr[valid_mask]
+            valid_timestamps_days = valid_timestamps_arr.tolist()
+            if len(valid_timestamps_days) == len(documents):
+                valid_documents = documents
+            else:
+                valid_documents = np.asarray(documents, dtype=object)[valid_mask].tolist()
+            unique_dates = int(np.unique(valid_timestamps_arr).size)
             
-            if len(valid_timestamps_days) >= 2 and len(set(valid_timestamps_days)) >= 2:
+            if len(valid_timestamps_days) >= 2 and unique_dates >= 2:
                 logger.info(f"Running dynamic topic analysis with {len(valid_documents)}/{len(documents)} documents that have valid dates...")
                 try:
                     # Convert days-since-epoch to date strings for BERTopic
                     # IMPORTANT: Use string format with datetime_format parameter to preserve exact dates
                     # If we pass datetime objects with nr_bins, BERTopic creates equal-interval bins
                     # which loses the original date granularity (all dates become bin boundaries like 01-01)
-                    from datetime import datetime, timedelta
-                    epoch = datetime(1970, 1, 1)
-                    
-                    # Convert to YYYY-MM-DD string format for BERTopic
-                    valid_timestamps_str = []
-                    for d in valid_timestamps_days:
-                        date_obj = epoch + timedelta(days=d)
-                        valid_timestamps_str.append(date_obj.strftime('%Y-%m-%d'))
+                    # Convert to YYYY-MM-DD string format for BERTopic (numpy formats
+                    # datetime64[D] values as YYYY-MM-DD in one vectorized call)
+                    valid_timestamps_str = np.datetime_as_string(
+                        valid_timestamps_arr.astype('datetime64[D]'), unit='D'
+                    ).tolist()
                     
                     # Debug: log the conversion
                     logger.info(f"Days since epoch sample: {valid_timestamps_days[:5]}")
@@ -455,7 +719,6 @@ class BERTopicService:
                         else:
                             # Don't set nr_bins - let BERTopic group by original dates
                             # This preserves the original date granularity
-                            unique_dates = len(set(valid_timestamps_days))
                             logger.info(f"nr_bins not specified, BERTopic will group by original dates ({unique_dates} unique dates)")
                         if 'evolution_tuning' in dynamic_config:
                             dynamic_params['evolution_tuning'] = dynamic_config['evolution_tuning']
@@ -487,11 +750,14 @@ class BERTopicService:
                     traceback.print_exc()
                     topics_over_time_data = None
             else:
-                logger.warning(f"Not enough valid timestamps for dynamic analysis: {len(valid_timestamps_days)} valid, {len(set(valid_timestamps_days))} unique")
+                logger.warning(f"Not enough valid timestamps for dynamic analysis: {len(valid_timestamps_days)} valid, {unique_dates} unique")
         
         analysis_time = time.time() - start_time
         logger.info(f"Analysis completed in {analysis_time:.2f}s")
         
+        # Tokenized documents are only reused within one analysis
+        _cut_chinese_piece.cache_clear()
+        
         # Prepare results
         result = self._prepare_results(topic_model, topics, probs, documents, topic_info)
         result['stats']['analysis_time'] = round(analysis_time, 2)
@@ -520,25 +786,26 @@ class BERTopicService:
         topic_info: pd.DataFrame
     ) -> List[Dict[str, Any]]:
         """Convert topics_over_time DataFrame to serializable format"""
-        result = []
+        # Whole-column conversions instead of iterrows, which builds a Series per row
+        topic_ids = topics_over_time_df['Topic'].astype(int)
         
         # Create topic name mapping
         topic_names = {}
-        for _, row in topic_info.iterrows():
-            topic_id = int(row['Topic'])
-            topic_names[topic_id] = row.get('Name', f'Topic {topic_id}')
-        
-        for _, row in topics_over_time_df.iterrows():
-            topic_id = int(row['Topic'])
-            result.append({
-                'topic': topic_id,
-                'topic_name': topic_names.get(topic_id, f'Topic {topic_id}'),
-                'words': row.get('Words', ''),
-                'frequency': float(row.get('Frequency', 0)),
-                'timestamp': str(row.get('Timestamp', ''))
-            })
-        
-        return result
+        if 'Name' in topic_info.columns:
+            topic_names = dict(zip(topic_info['Topic'].astype(int), topic_info['Name']))
+        names = topic_ids.map(topic_names)
+        names = names.where(names.notna(), 'Topic ' + topic_ids.astype(str))
+        
+        out_df = pd.DataFrame({
+            'topic': topic_ids,
+            'topic_name': names,
+            'words': topics_over_time_df['Words'].fillna(''),
+            'frequency': topics_over_time_df['Frequency'].astype(float),
+            # str() per value, matching the old str(Timestamp) output
+            'timestamp': topics_over_time_df['Timestamp'].map(str)
+        })
+        
+        return out_df.to_dict('records')
     
     def _prepare_results(
         self,
@@ -552,11 +819,14 @@ class BERTopicService:
         
         # Convert topic info to dict
         topic_list = []
-        for _, row in topic_info.iterrows():
-            topic_id = int(row['Topic'])
+        # All topic representations in one call, and plain tuples instead of a
+        # Series per row
+        all_topics = topic_model.get_topics()
+        for row in topic_info.itertuples(index=False):
+            topic_id = int(row.Topic)
             
             # Get topic words
-            topic_words = topic_model.get_topic(topic_id)
+            topic_words = all_topics.get(topic_id, [])
             words = []
             if topic_words:
                 # Filter out empty words and ensure valid data (max 20 words)
@@ -566,30 +836,44 @@ class BERTopicService:
             
             topic_list.append({
                 'id': topic_id,
-                'name': row.get('Name', f'Topic {topic_id}'),
-                'count': int(row['Count']),
+                'name': getattr(row, 'Name', f'Topic {topic_id}'),
+                'count': int(row.Count),
                 'words': words,
-                'custom_label': row.get('CustomName', row.get('Custom_Label', ''))
+                'custom_label': getattr(row, 'CustomName', getattr(row, 'Custom_Label', ''))
             })
         
+        # Topic ids as one array, reused for the outlier count
+        topics_arr = np.asarray(topics, dtype=np.int64)
+        
         # Document-topic assignments
-        doc_topics = []
-        for i, (doc, topic) in enumerate(zip(documents, topics)):
-            doc_info = {
+        doc_topics = [
+            {
                 'index': i,
-                'topic': int(topic),
+                'topic': topic,
                 'text_preview': doc[:100] + ('...' if len(doc) > 100 else '')
             }
-            if probs is not None and len(probs) > i:
-                if isinstance(probs[i], np.ndarray):
-                    doc_info['probability'] = float(np.max(probs[i]))
-                else:
-                    doc_info['probability'] = float(probs[i]) if probs[i] is not None else None
-            doc_topics.append(doc_info)
+            for i, (doc, topic) in enumerate(zip(documents, topics_arr.tolist()))
+        ]
+        
+        # Per-document probability: the highest topic probability when the full
+        # distribution was calculated (one max over the matrix, not one per row)
+        if probs is not None:
+            if isinstance(probs, np.ndarray) and probs.ndim == 2:
+                doc_probs = probs.max(axis=1).astype(float).tolist()
+            elif isinstance(probs, np.ndarray) and probs.dtype.kind in 'fiub':
+                doc_probs = probs.astype(float).tolist()
+            else:
+                doc_probs = [
+                    float(np.max(p)) if isinstance(p, np.ndarray) else (float(p) if p is not None else None)
+                    for p in probs
+                ]
+            # zip stops at the shorter list, as the old len(probs) > i check did
+            for doc_info, probability in zip(doc_topics, doc_probs):
+                doc_info['probability'] = probability
         
         # Statistics
         valid_topics = [t for t in topic_list if t['id'] != -1]
-        outlier_count = sum(1 for t in topics if t == -1)
+        outlier_count = int(np.count_nonzero(topics_arr == -1))
         
         return {
             'topics': topic_list,
@@ -609,31 +893,62 @@ class BERTopicService:
         
         result_path = self.results_dir / f"{result_id}.json"
         
-        import json
-        with open(result_path, 'w', encoding='utf-8') as f:
-            json.dump(save_data, f, ensure_ascii=False, indent=2)
+        # Compact output: document_topics has one entry per document, and
+        # indentation roughly doubles the file for large corpora
+        data = None
+        if orjson is not None:
+            try:
+                data = orjson.dumps(
+                    save_data,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                )
+            except TypeError as e:
+                logger.warning(f"orjson could not serialize results ({e}), using json")
+        
+        if data is not None:
+            with open(result_path, 'wb') as f:
+                f.write(data)
+        else:
+            import json
+            with open(result_path, 'w', encoding='utf-8') as f:
+                json.dump(save_data, f, ensure_ascii=False, separators=(',', ':'))
         
         logger.info(f"Results saved to {result_path}")
         return str(result_path)
     
     def save_model(self, topic_model, model_id: str) -> str:
-        """Save BERTopic model for later use"""
-        model_path = self.results_dir / f"{model_id}_model.pkl"
+        """
+        Save BERTopic model for later use.
+        Written with joblib, which stores the model's numpy arrays (embeddings,
+        topic vectors) as raw buffers next to the pickle stream instead of
+        copying them through it, so they can be memory-mapped on load.
+        """
+        import joblib
         
-        with open(model_path, 'wb') as f:
-            pickle.dump(topic_model, f)
+        model_path = self.results_dir / f"{model_id}_model.joblib"
+        joblib.dump(topic_model, model_path)
         
         logger.info(f"Model saved to {model_path}")
         return str(model_path)
     
     def load_model(self, model_id: str):
-        """Load saved BERTopic model"""
-        model_path = self.results_dir / f"{model_id}_model.pkl"
+        """
+        Load saved BERTopic model.
+        Large arrays are memory-mapped copy-on-write, so they are read lazily
+        and the model can still modify them. Models saved as pickle by earlier
+        versions are still loaded.
+        """
+        import joblib
+        
+        model_path = self.results_dir / f"{model_id}_model.joblib"
+        if model_path.exists():
+            return joblib.load(model_path, mmap_mode='c')
         
-        if not model_path.exists():
+        legacy_path = self.results_dir / f"{model_id}_model.pkl"
+        if not legacy_path.exists():
             raise FileNotFoundError(f"Model not found: {model_path}")
         
-        with open(model_path, 'rb') as f:
+        with open(legacy_path, 'rb') as f:
             return pickle.load(f)
 
 
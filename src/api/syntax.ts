@@ -104,6 +104,36 @@ export const syntaxApi = {
     })
   },
 
+  /**
+   * Analyze constituency structure of several sentences in one request
+   */
+  analyzeConstituencyBatch: async (
+    sentences: string[],
+    language: string = 'english'
+  ): Promise<ApiResponse<ConstituencyResponse[]>> => {
+    return api.post<ConstituencyResponse[]>('/api/syntax/constituency/batch', {
+      sentences,
+      language
+    })
+  },
+
+  /**
+   * Analyze dependency structure of several sentences in one request
+   */
+  analyzeDependencyBatch: async (
+    sentences: string[],
+    language: string = 'english',
+    options?: DependencyOptions
+  ): Promise<ApiResponse<DependencyResponse[]>> => {
+    return api.post<DependencyResponse[]>('/api/syntax/dependency/batch', {
+      sentences,
+      language,
+      compact: options?.compact ?? false,
+      collapse_punct: options?.collapse_punct ?? true,
+      collapse_phrases: options?.collapse_phrases ?? false
+    })
+  },
+
   /**
    * Get syntax service status
    */
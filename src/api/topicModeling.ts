@@ -96,6 +96,7 @@ export async function createEmbedding(
     batchSize?: number
     device?: string
     normalize?: boolean
+    halfPrecision?: boolean
     language?: string
     chunking?: ChunkingConfig
   } = {}
@@ -107,6 +108,7 @@ export async function createEmbedding(
     batch_size: options.batchSize || 32,
     device: options.device || 'cpu',
     normalize: options.normalize || false,
+    half_precision: options.halfPrecision || false,
     language: options.language || 'english',
     chunking: options.chunking
   })
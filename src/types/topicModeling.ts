@@ -143,6 +143,7 @@ export interface VectorizerConfig {
     ngram_range?: [number, number]
     stop_words?: string[] | null
   }
+  lowercased?: boolean
 }
 
 export interface RepresentationModelConfig {
@@ -154,6 +155,7 @@ export interface OutlierConfig {
   enabled: boolean
   strategy: 'distributions' | 'probabilities' | 'c-tf-idf' | 'embeddings'
   threshold: number
+  update_topic_representations?: boolean
 }
 
 export interface AnalysisConfig {
@@ -173,6 +175,7 @@ export interface AnalysisConfig {
     corpus_id?: string
     text_ids?: string[]
   }
+  accelerator?: 'cpu' | 'cuda'
 }
 
 // ============ Analysis Result Types ============